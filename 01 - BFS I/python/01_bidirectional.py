@@ -0,0 +1,175 @@
+from collections import deque
+
+
+def reverseGraph(graph):
+    """Creates the reverse adjacency of a directed graph
+
+    Args:
+        graph (dict): Search space represented by a graph
+
+    Returns:
+        reverse (dict): A graph where every edge points the other way
+    """
+    reverse = {}
+    for node, neighbours in graph.items():
+        for neighbour in neighbours:
+            reverse.setdefault(neighbour, []).append(node)
+    return reverse
+
+
+def bfsForward(graph, start, goal):
+    """Finds shortest path between 2 nodes using a one-sided BFS,
+    counting the expanded nodes so it can be compared with bfsBidirectional
+
+    Args:
+        graph (dict): Search space represented by a graph
+        start (str): Starting state
+        goal (str): Goal state
+
+    Returns:
+        tuple (path, expanded): The shortest path (or None), and how many
+            nodes were expanded to find it
+    """
+    if start == goal:
+        return [start], 0
+
+    parents = {start: None}
+    queue = deque([start])
+    expanded = 0
+
+    while queue:
+        node = queue.popleft()
+        expanded += 1
+
+        for neighbour in graph.get(node, []):
+            if neighbour not in parents:
+                parents[neighbour] = node
+                if neighbour == goal:
+                    return treePath(parents, goal), expanded
+                queue.append(neighbour)
+
+    return None, expanded
+
+
+def bfsBidirectional(graph, start, goal, directed=True, reverse=None):
+    """Finds shortest path between 2 nodes by searching forwards from the
+    start and backwards from the goal until the two searches meet
+
+    Args:
+        graph (dict): Search space represented by a graph
+        start (str): Starting state
+        goal (str): Goal state
+        directed (bool): Whether some edges only go one way. Pass False for
+            an undirected graph, which is its own reverse, so nothing extra
+            is built
+        reverse (dict): A prebuilt reverse graph, worth passing when the same
+            directed graph is searched many times. If None and the graph is
+            directed, it is built the first time the backward search needs it
+
+    Returns:
+        tuple (path, expanded): The shortest path (or None), and how many
+            nodes were expanded by both searches together
+    """
+
+    # return a simple path if start is the goal
+    if start == goal:
+        return [start], 0
+
+    if reverse is None and not directed:
+        reverse = graph
+
+    # each side keeps one parent per discovered node, and a frontier
+    forwardParents = {start: None}
+    backwardParents = {goal: None}
+    forwardFrontier = [start]
+    backwardFrontier = [goal]
+    expanded = 0
+
+    while forwardFrontier and backwardFrontier:
+
+        # always grow the smaller frontier, a whole level at a time
+        if len(forwardFrontier) <= len(backwardFrontier):
+            adjacency = graph
+            frontier, parents, others = forwardFrontier, forwardParents, backwardParents
+        else:
+            # only build the reverse graph when we first search backwards
+            if reverse is None:
+                reverse = reverseGraph(graph)
+            adjacency = reverse
+            frontier, parents, others = backwardFrontier, backwardParents, forwardParents
+
+        nextFrontier = []
+        meeting = None
+        best = None
+
+        for node in frontier:
+            expanded += 1
+            for neighbour in adjacency.get(node, []):
+                if neighbour in parents:
+                    continue
+                parents[neighbour] = node
+                nextFrontier.append(neighbour)
+
+                # the searches meet: keep the shortest join within this level
+                if neighbour in others:
+                    length = len(treePath(parents, neighbour)) + len(treePath(others, neighbour))
+                    if best is None or length < best:
+                        best = length
+                        meeting = neighbour
+
+        if meeting is not None:
+            # start ... meeting from the forward side, meeting ... goal from the backward side
+            path = treePath(forwardParents, meeting)
+            path += treePath(backwardParents, meeting)[-2::-1]
+            return path, expanded
+
+        if parents is forwardParents:
+            forwardFrontier = nextFrontier
+        else:
+            backwardFrontier = nextFrontier
+
+    # we couldn't find the goal... :(
+    return None, expanded
+
+
+def treePath(parents, node):
+    """Rebuilds the path from the root of a BFS tree to a node, the same way
+    as treePath in the search package of "02 - BFS II"
+
+    Args:
+        parents (dict): The parent of every node, None for the root
+        node (str): The last node of the path
+
+    Returns:
+        path (list): The states from the root to the node
+    """
+    path = [node]
+    while parents[path[-1]] is not None:
+        path.append(parents[path[-1]])
+    path.reverse()
+    return path
+
+
+if __name__ == "__main__":
+
+    # simple search space, represented by a dictionary
+    graph = {
+        "A": ["B", "C", "E"],
+        "B": ["A", "D", "E"],
+        "C": ["A", "F", "G"],
+        "D": ["B", "E"],
+        "E": ["A", "B", "D"],
+        "F": ["C"],
+        "G": ["C"]
+    }
+
+    path, expanded = bfsForward(graph, "G", "D")
+    print("One-sided BFS found {} after expanding {} nodes".format(path, expanded))
+
+    path, expanded = bfsBidirectional(graph, "G", "D", directed=False)
+    print("Bidirectional BFS found {} after expanding {} nodes".format(path, expanded))
+
+    # one-way edges, so the backward search needs the reverse graph
+    oneWay = {"A": ["B"], "B": ["C"], "C": ["A", "D"]}
+    path, expanded = bfsBidirectional(oneWay, "B", "A")
+    print("On a directed graph it found {} after expanding {} nodes".format(path, expanded))
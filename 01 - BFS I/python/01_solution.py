@@ -80,6 +80,64 @@ def bfsShortestPath(graph, start, goal):
     return None
 
 
+def bfsShortestPathParents(graph, start, goal):
+    """Finds shortest path between 2 nodes in a graph using BFS, storing
+    one parent per node instead of a whole path per queue entry
+
+    Args:
+        graph (dict): Search space represented by a graph
+        start (str): Starting state
+        goal (str): Goal state
+
+    Returns:
+        path (list): List of the states that bring you from the start to
+            the goal state, in the quickest way possible
+    """
+
+    # return a simple path if start is the goal
+    if start == goal:
+        return [start]
+
+    # remember where we came from for every discovered node.
+    # this doubles as the explored set, with O(1) lookups
+    parents = {start: None}
+
+    # the FIFO queue only holds nodes, not paths
+    queue = deque()
+    queue.append(start)
+
+    # keep looping until there are no nodes still to be checked
+    while len(queue) > 0:
+
+        # pop first item from queue (FIFO)
+        node = queue.popleft()
+
+        # get neighbours if node is present, otherwise default to empty list
+        neighbours = graph.get(node, [])
+
+        # go through all neighbour nodes
+        for neighbour in neighbours:
+            # skip nodes we have already discovered
+            if neighbour in parents:
+                continue
+
+            parents[neighbour] = node
+
+            # walk back through the parents to build the path, once
+            if neighbour == goal:
+                path = [neighbour]
+                while parents[path[-1]] is not None:
+                    path.append(parents[path[-1]])
+                path.reverse()
+                return path
+
+            # push it onto the queue for further exploration
+            queue.append(neighbour)
+
+    # we couldn't find the goal... :(
+    return None
+
+
 if __name__ == "__main__":
 
     # simple search space, represented by a dictionary
@@ -96,3 +154,7 @@ if __name__ == "__main__":
     result = bfsShortestPath(graph, "G", "D")
 
     print("Here's the shortest path between nodes \"G\" and \"D\": {}".format(result))
+
+    result = bfsShortestPathParents(graph, "G", "D")
+
+    print("...and the same path found with parent pointers: {}".format(result))
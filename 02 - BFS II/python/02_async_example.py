@@ -0,0 +1,57 @@
+import asyncio
+import random
+from time import time
+from search import AsyncNeighbours, LatencyService, asyncBestPath, asyncBfsPath, bestPath, bfsPath
+
+
+async def sequentialBfsPath(service, start, goal):
+    """The plain BFS with one awaited round trip per node, for comparison"""
+    parents = {start: None}
+    queue = [start]
+    for node in queue:
+        if node == goal:
+            break
+        for neighbour in await service.fetch(node):
+            if neighbour not in parents:
+                parents[neighbour] = node
+                queue.append(neighbour)
+    return goal in parents
+
+
+async def main():
+    # a random graph behind a service that takes 2ms per lookup
+    random.seed(0)
+    numNodes = 5000
+    graph = {i: random.sample(range(numNodes), 4) for i in range(numNodes)}
+    weightedGraph = {i: [(n, random.randint(1, 10)) for n in graph[i]] for i in graph}
+    start, goal = 0, numNodes - 1
+
+    service = LatencyService(graph, latency=0.002, jitter=0.001, seed=0)
+    t1 = time()
+    await sequentialBfsPath(service, start, goal)
+    print("One fetch at a time:    {:.2f}s, {} fetches".format(time() - t1, service.calls))
+
+    service = LatencyService(graph, latency=0.002, jitter=0.001, seed=0)
+    neighbours = AsyncNeighbours(service.fetch, concurrency=64)
+    t1 = time()
+    path = await asyncBfsPath(neighbours, start, goal)
+    print("Whole frontier at once: {:.2f}s, {} fetches, at most {} in flight".format(
+        time() - t1, service.calls, service.peakInFlight))
+    assert len(path) == len(bfsPath(graph, start, goal))
+
+    # a second query reuses the cached neighbours
+    t1 = time()
+    await asyncBfsPath(neighbours, start, goal // 2)
+    print("Second query:           {:.2f}s, {} hits, {} misses".format(
+        time() - t1, neighbours.hits, neighbours.misses))
+
+    service = LatencyService(weightedGraph, latency=0.002, jitter=0.001, seed=0)
+    neighbours = AsyncNeighbours(service.fetch, concurrency=16)
+    t1 = time()
+    path, cost = await asyncBestPath(neighbours, start, goal, lookahead=16)
+    print("Dijkstra with prefetch: {:.2f}s, {} fetches, cost {}".format(time() - t1, service.calls, cost))
+    assert cost == bestPath(weightedGraph, start, goal)[1]
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,29 @@
+import random
+from time import time
+from search import batchShortestPaths, bfsPath
+
+
+if __name__ == "__main__":
+
+    # a random graph, and lots of queries that share a few hundred start nodes
+    random.seed(0)
+    numNodes = 10000
+    graph = {i: random.sample(range(numNodes), 4) for i in range(numNodes)}
+    starts = random.sample(range(numNodes), 100)
+    queries = [(random.choice(starts), random.randrange(numNodes)) for i in range(2000)]
+
+    t1 = time()
+    single = [bfsPath(graph, start, goal) for start, goal in queries]
+    print("One BFS per query:      {:.2f}s".format(time() - t1))
+
+    t1 = time()
+    batched = batchShortestPaths(graph, queries)
+    print("One BFS per start node: {:.2f}s".format(time() - t1))
+
+    t1 = time()
+    parallel = batchShortestPaths(graph, queries, workers=4)
+    print("...over 4 processes:    {:.2f}s".format(time() - t1))
+
+    # every answer should be a shortest path
+    lengths = [len(p) if p else 0 for p in single]
+    assert lengths == [len(p) if p else 0 for p in batched] == [len(p) if p else 0 for p in parallel]
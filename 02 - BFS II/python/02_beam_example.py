@@ -0,0 +1,29 @@
+from time import time
+from search import GridGraph, beamSearch, bfsPath, octileHeuristic
+
+
+if __name__ == "__main__":
+
+    # an open grid, where the BFS frontier grows with every level
+    size = 1000
+    grid = GridGraph(size, size)
+    heuristic = octileHeuristic(grid)
+    start, goal = grid.node(0, size // 2), grid.node(size - 1, size // 3)
+
+    t1 = time()
+    path = bfsPath(grid, start, goal)
+    print("BFS:              {:.2f}s, {} steps".format(time() - t1, len(path) - 1))
+
+    for width in [1000, 10, 1]:
+        t1 = time()
+        path, optimal = beamSearch(grid, start, goal, heuristic, width=width)
+        print("Beam width {:<5} {:.2f}s, {} steps, guaranteed optimal: {}".format(
+            width, time() - t1, len(path) - 1, optimal))
+
+    # a nearby goal is found before the frontier ever gets wider than the beam
+    path, optimal = beamSearch(grid, start, start + 10, heuristic, width=1000)
+    print("Nearby goal: {} steps, guaranteed optimal: {}".format(len(path) - 1, optimal))
+
+    # with a hard cap that's too small the beam can't reach the goal
+    path, optimal = beamSearch(grid, start, goal, heuristic, width=10, maxNodes=500)
+    print("Capped at 500 nodes: found {}, guaranteed: {}".format(path is not None, optimal))
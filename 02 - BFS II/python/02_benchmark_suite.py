@@ -0,0 +1,100 @@
+import json
+import platform
+import sys
+import tracemalloc
+from time import time
+from search import bfsCSR, bfsLevels, bfsTree, gridGraph, loadFunction, powerLawGraph, randomGraph
+
+
+def implementations():
+    """Lists the BFS implementations to compare
+
+    Returns:
+        list of (name, graph form, function(graph, start), largest graph to try).
+        The quadratic ones are only run on small graphs
+    """
+    bfs = loadFunction("01 - BFS I/python/01_bfs_example.py", "bfs")
+    bfsShortestPath = loadFunction("01 - BFS I/python/01_solution.py", "bfsShortestPath")
+    bfsConnectedComponent = loadFunction("_legacy/breadth-first-search/bfs.py", "bfs_connected_component")
+
+    # a goal that is never found makes the shortest path search visit everything
+    unreachable = object()
+
+    return [
+        ("01_bfs_example.bfs (list pop(0))", "dict", bfs, 10 ** 4),
+        ("01_solution.bfsShortestPath (deque)", "dict", lambda g, s: bfsShortestPath(g, s, unreachable), 10 ** 4),
+        ("_legacy bfs_connected_component", "dict", bfsConnectedComponent, 10 ** 4),
+        ("search.bfsTree", "dict", bfsTree, 10 ** 6),
+        ("search.bfsCSR", "csr", bfsCSR, 10 ** 7),
+        ("search.bfsLevels", "csr", bfsLevels, 10 ** 7),
+    ]
+
+
+def generators():
+    """Lists the graph families, as functions of the number of nodes"""
+    return [
+        ("random", lambda n: randomGraph(n, 4, seed=0)),
+        ("grid", lambda n: gridGraph(int(n ** 0.5), int(n ** 0.5))),
+        ("power-law", lambda n: powerLawGraph(n, 4, seed=0)),
+    ]
+
+
+def measure(fn, *args):
+    """Times one run of a function, then runs it again to find its peak memory
+
+    Returns:
+        tuple (seconds, peak bytes)
+    """
+    t1 = time()
+    fn(*args)
+    elapsed = time() - t1
+
+    tracemalloc.start()
+    fn(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+if __name__ == "__main__":
+
+    # usage: python 02_benchmark_suite.py [largest size] [results file]
+    largest = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 5
+    output = sys.argv[2] if len(sys.argv) > 2 else "bench_results.json"
+
+    sizes = [10 ** k for k in range(3, 8) if 10 ** k <= largest]
+    impls = implementations()
+    results = []
+
+    for graphName, generate in generators():
+        for size in sizes:
+            csr = generate(size)
+
+            # only build the dict form if something still uses it at this size
+            needsDict = any(form == "dict" and size <= limit for _, form, _, limit in impls)
+            graph = csr.toDict() if needsDict else None
+
+            for implName, form, fn, limit in impls:
+                if size > limit:
+                    continue
+
+                seconds, peak = measure(fn, graph if form == "dict" else csr, 0)
+                results.append({
+                    "graph": graphName,
+                    "nodes": len(csr),
+                    "edges": csr.numEdges,
+                    "implementation": implName,
+                    "seconds": seconds,
+                    "peakBytes": peak,
+                })
+                print("{:10} {:>9} | {:40} | {:9.4f}s | {:9.1f} MB".format(
+                    graphName, len(csr), implName, seconds, peak / 1e6))
+
+    with open(output, "w") as f:
+        json.dump({
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        }, f, indent=2, sort_keys=True)
+
+    print("Results written to {}".format(output))
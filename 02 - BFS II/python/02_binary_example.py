@@ -0,0 +1,31 @@
+import os
+import tempfile
+import numpy as np
+from time import time
+from search import CSRGraph, bestPathCSR, bfsShortestPathCSR, loadGraph, saveGraph
+
+
+if __name__ == "__main__":
+
+    # a random weighted graph with a million nodes and five million edges
+    numNodes = 1000000
+    numEdges = 5000000
+    rng = np.random.default_rng(0)
+    names = ["n{}".format(i) for i in range(numNodes)]
+    graph = CSRGraph.fromEdges(names, rng.integers(0, numNodes, numEdges),
+                               rng.integers(0, numNodes, numEdges), rng.integers(1, 10, numEdges))
+
+    path = os.path.join(tempfile.mkdtemp(), "random.csr")
+    t1 = time()
+    saveGraph(graph, path)
+    print("Saved {} ({:.0f} MB) in {:.2f}s".format(graph, os.path.getsize(path) / 1e6, time() - t1))
+
+    # opening the file only maps it, nothing is parsed
+    t1 = time()
+    graph = loadGraph(path)
+    print("Loaded in {:.1f}ms".format((time() - t1) * 1000))
+
+    t1 = time()
+    print("Fewest hops from n0 to n1: {}".format(bfsShortestPathCSR(graph, "n0", "n1")))
+    print("Cheapest path from n0 to n1: {}".format(bestPathCSR(graph, "n0", "n1")))
+    print("Both searches took {:.2f}s".format(time() - t1))
@@ -0,0 +1,33 @@
+import random
+from time import time
+from search import SearchCache, VersionedGraph, loadFunction
+
+
+if __name__ == "__main__":
+
+    bfsShortestPath = loadFunction("01 - BFS I/python/01_solution.py", "bfsShortestPath")
+
+    random.seed(0)
+    numNodes = 1000
+    graph = VersionedGraph({i: random.sample(range(numNodes), 3) for i in range(numNodes)})
+
+    # most queries repeat a few popular (start, goal) pairs
+    pairs = [(random.randrange(numNodes), random.randrange(numNodes)) for i in range(100)]
+    queries = random.choices(pairs, weights=[1 / (i + 1) for i in range(len(pairs))], k=1000)
+
+    t1 = time()
+    uncached = [bfsShortestPath(graph, start, goal) for start, goal in queries]
+    print("No cache:   {:.2f}s".format(time() - t1))
+
+    cache = SearchCache(graph, bfsShortestPath, maxSize=50)
+    t1 = time()
+    cached = [cache(start, goal) for start, goal in queries]
+    print("With cache: {:.2f}s, hit rate {:.0%}, {}".format(time() - t1, cache.hitRate, cache))
+    assert cached == uncached
+
+    # changing the graph empties the cache, so answers are never stale
+    start, goal = queries[0]
+    path = cache(start, goal)
+    graph.addEdge(start, goal)
+    print("Before the new edge: {} steps, after: {} steps, {}".format(
+        len(path) - 1, len(cache(start, goal)) - 1, cache))
@@ -0,0 +1,29 @@
+from search import CSRGraph, IncrementalComponents, connectedComponents
+
+
+if __name__ == "__main__":
+
+    # the letter graph from "01 - BFS I", plus a second island of nodes
+    graph = {
+        "A": ["B", "C", "E"],
+        "B": ["A", "D", "E"],
+        "C": ["A", "F", "G"],
+        "D": ["B", "E"],
+        "E": ["A", "B", "D"],
+        "F": ["C"],
+        "G": ["C"],
+        "X": ["Y"],
+        "Y": ["X"],
+        "Z": []
+    }
+
+    # label every node in one pass, instead of one BFS per component
+    csr = CSRGraph.fromDict(graph)
+    labels = connectedComponents(csr)
+    print("Components: {}".format(dict(zip(csr.names, labels.tolist()))))
+
+    # new edges only ever merge components
+    components = IncrementalComponents(graph)
+    components.addEdge("Z", "Y")
+    print("After adding Z-Y there are {} components, and Z is connected to X: {}".format(
+        components.numComponents, components.connected("Z", "X")))
@@ -0,0 +1,41 @@
+import os
+import random
+import tempfile
+from time import time
+from search import ContractionHierarchy, bestPath, roadGraph
+
+
+if __name__ == "__main__":
+
+    graph = roadGraph(100, 100, seed=0)
+    nodes = list(graph)
+
+    t1 = time()
+    hierarchy = ContractionHierarchy(graph)
+    print("Preprocessing: {:.2f}s, {}".format(time() - t1, hierarchy))
+
+    random.seed(0)
+    queries = [(random.choice(nodes), random.choice(nodes)) for i in range(200)]
+
+    t1 = time()
+    expected = [bestPath(graph, start, goal)[1] for start, goal in queries]
+    elapsed = time() - t1
+    print("Dijkstra:            {:8.0f}us per query".format(elapsed / len(queries) * 1e6))
+
+    t1 = time()
+    costs = [hierarchy.distance(start, goal) for start, goal in queries]
+    print("Contraction (cost):  {:8.0f}us per query".format((time() - t1) / len(queries) * 1e6))
+    assert costs == expected
+
+    t1 = time()
+    paths = [hierarchy.shortestPath(start, goal) for start, goal in queries]
+    print("Contraction (path):  {:8.0f}us per query".format((time() - t1) / len(queries) * 1e6))
+    assert [cost for _, cost in paths] == expected
+
+    # the hierarchy only needs building once
+    path = os.path.join(tempfile.mkdtemp(), "hierarchy.npz")
+    hierarchy.save(path)
+    loaded = ContractionHierarchy.load(path)
+    start, goal = queries[0]
+    print("Loaded from {}: cost {}".format(path, loaded.distance(start, goal)))
+    os.remove(path)
@@ -0,0 +1,107 @@
+import random
+from search import countShortestPaths, countWalks, countWalksMatrix, countDagPaths
+
+
+def allWalks(graph, start, goal, maxLength):
+    """Counts the walks of at most maxLength edges by listing every one of them
+
+    Args:
+        graph (dict): Search space represented by a graph
+        start (str): Starting state
+        goal (str): Goal state
+        maxLength (int): The longest walk to count, in edges
+
+    Returns:
+        (list): Every walk from start to goal, as a list of nodes
+    """
+    walks = []
+    stack = [[start]]
+    while stack:
+        walk = stack.pop()
+        if walk[-1] == goal:
+            walks.append(walk)
+        if len(walk) <= maxLength:
+            for neighbour in graph.get(walk[-1], []):
+                stack.append(walk + [neighbour])
+    return walks
+
+
+def allPaths(graph, start, goal):
+    """Lists every path from start to goal that doesn't visit a node twice
+
+    Args:
+        graph (dict): Search space represented by a graph
+        start (str): Starting state
+        goal (str): Goal state
+
+    Returns:
+        (list): Every path from start to goal, as a list of nodes
+    """
+    paths = []
+    stack = [[start]]
+    while stack:
+        path = stack.pop()
+        if path[-1] == goal:
+            paths.append(path)
+            continue
+        for neighbour in graph.get(path[-1], []):
+            if neighbour not in path:
+                stack.append(path + [neighbour])
+    return paths
+
+
+def randomDag(numNodes, numEdges, rng):
+    """Creates a random directed acyclic graph, where edges only go from lower
+    to higher numbers. Repeated edges are kept, they are separate paths"""
+    graph = {node: [] for node in range(numNodes)}
+    for _ in range(numEdges):
+        a, b = sorted(rng.sample(range(numNodes), 2))
+        graph[a].append(b)
+    return graph
+
+
+if __name__ == "__main__":
+
+    # the letter graph from "01 - BFS I"
+    graph = {
+        "A": ["B", "C", "E"],
+        "B": ["A", "D", "E"],
+        "C": ["A", "F", "G"],
+        "D": ["B", "E"],
+        "E": ["A", "B", "D"],
+        "F": ["C"],
+        "G": ["C"]
+    }
+
+    distance, count = countShortestPaths(graph, "G", "D")
+    print("There are {} shortest paths between nodes \"G\" and \"D\", of {} moves".format(count, distance))
+    print("...and {} walks of at most 8 moves".format(countWalks(graph, "G", "D", 8)))
+
+    # every count should match listing the paths one by one
+    for start in graph:
+        for goal in graph:
+            walks = allWalks(graph, start, goal, 6)
+            shortest = min(len(walk) for walk in walks) - 1
+            assert countShortestPaths(graph, start, goal) == (shortest, sum(len(walk) - 1 == shortest for walk in walks))
+            assert countWalks(graph, start, goal, 6) == len(walks)
+            assert countWalksMatrix(graph, start, goal, 6) == len(walks)
+            assert countWalksMatrix(graph, start, goal, 6, modulus=7) == len(walks) % 7
+
+    rng = random.Random(0)
+    for _ in range(50):
+        dag = randomDag(10, 25, rng)
+        for goal in dag:
+            paths = allPaths(dag, 0, goal)
+            assert countDagPaths(dag, 0, goal) == len(paths)
+            assert countDagPaths(dag, 0, goal, modulus=3) == len(paths) % 3
+
+    # with a cycle on the way there are infinitely many paths
+    for cyclic in [{"A": ["B"], "B": ["A", "C"]}, {"A": ["A", "C"]}, {"A": ["B"], "B": ["C"], "C": ["B"]}]:
+        try:
+            countDagPaths(cyclic, "A", "C")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("{} has a cycle".format(cyclic))
+
+    print("Paths from 0 to 9 in a random DAG: {}".format(countDagPaths(randomDag(10, 25, rng), 0, 9)))
@@ -0,0 +1,100 @@
+import random
+import tracemalloc
+from collections import deque
+from time import time
+from search import CSRGraph, bfsCSR, bfsLevels
+
+
+def randomGraph(numNodes, degree):
+    """Creates a random dict graph with string node names
+
+    Args:
+        numNodes (int): How many nodes to create
+        degree (int): How many neighbours each node gets
+
+    Returns:
+        graph (dict): Search space represented by a graph
+    """
+    names = ["n{}".format(i) for i in range(numNodes)]
+    return {name: random.sample(names, degree) for name in names}
+
+
+def bfsDict(graph, start):
+    """Visits all the nodes of a dict graph using BFS, with a deque and a set
+
+    Args:
+        graph (dict): Search space represented by a graph
+        start (str): Starting state
+
+    Returns:
+        explored (list): List of the explored nodes
+    """
+    explored = {start}
+    order = [start]
+    queue = deque(order)
+    while queue:
+        node = queue.popleft()
+        for neighbour in graph.get(node, []):
+            if neighbour not in explored:
+                explored.add(neighbour)
+                order.append(neighbour)
+                queue.append(neighbour)
+    return order
+
+
+def measure(fn, *args):
+    """Runs a function twice, measuring its run time and then its peak memory.
+    tracemalloc slows down allocations a lot, so it is only on for the second run
+
+    Args:
+        fn (function): The function to run
+        *args: The arguments passed to the function
+
+    Returns:
+        tuple (result, seconds, peak bytes)
+    """
+    t1 = time()
+    fn(*args)
+    elapsed = time() - t1
+
+    tracemalloc.start()
+    result = fn(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+if __name__ == "__main__":
+
+    numNodes = 200000
+    degree = 8
+
+    random.seed(0)
+    print("Building a random graph with {} nodes and {} edges...".format(numNodes, numNodes * degree))
+
+    # the dict graph is measured while it is built, so we see all its lists and strings
+    graph, _, dictMemory = measure(randomGraph, numNodes, degree)
+
+    # the CSR graph shares the name strings with the dict, so measure what it keeps
+    tracemalloc.start()
+    csr = CSRGraph.fromDict(graph)
+    csrMemory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    dictOrder, dictTime, dictPeak = measure(bfsDict, graph, "n0")
+    csrOrder, csrTime, csrPeak = measure(bfsCSR, csr, "n0")
+
+    distances, levelsTime, levelsPeak = measure(bfsLevels, csr, "n0")
+
+    # both searches should visit exactly the same nodes in the same order
+    assert dictOrder == csrOrder
+    assert (distances >= 0).sum() == len(csrOrder)
+
+    print("{:6} | {:>12} | {:>12} | {:>10} | {:>12}".format("form", "graph MB", "arrays MB", "BFS time", "BFS peak MB"))
+    print("=" * 64)
+    print("{:6} | {:12.1f} | {:>12} | {:10.3f} | {:12.1f}".format(
+        "dict", dictMemory / 1e6, "-", dictTime, dictPeak / 1e6))
+    print("{:6} | {:12.1f} | {:12.1f} | {:10.3f} | {:12.1f}".format(
+        "CSR", csrMemory / 1e6, csr.nbytes / 1e6, csrTime, csrPeak / 1e6))
+    print("{:6} | {:>12} | {:>12} | {:10.3f} | {:12.1f}".format(
+        "levels", "-", "-", levelsTime, levelsPeak / 1e6))
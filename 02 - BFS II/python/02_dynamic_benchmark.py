@@ -0,0 +1,52 @@
+import random
+from time import time
+from search import DynamicBFS, bfsTree, treePath
+
+
+if __name__ == "__main__":
+
+    numNodes = 20000
+    degree = 4
+    numUpdates = 200
+
+    random.seed(0)
+    graph = {i: random.sample(range(numNodes), degree) for i in range(numNodes)}
+
+    # a stream of updates: half insert a random edge, half delete an existing one
+    updates = []
+    edges = [(node, neighbour) for node in graph for neighbour in graph[node]]
+    for i in range(numUpdates):
+        if i % 2 == 0:
+            updates.append(("insert", random.randrange(numNodes), random.randrange(numNodes)))
+        else:
+            updates.append(("delete",) + edges.pop(random.randrange(len(edges))))
+
+    dynamic = DynamicBFS(graph, 0)
+
+    # apply each update twice: once repairing the BFS, and once to the graph
+    # followed by a full BFS. Only the update itself is timed
+    dynamicTime = 0
+    fullTime = 0
+    repaired = 0
+    for kind, node, neighbour in updates:
+        t1 = time()
+        if kind == "insert":
+            repaired += dynamic.insertEdge(node, neighbour)
+        else:
+            repaired += dynamic.deleteEdge(node, neighbour)
+        dynamicTime += time() - t1
+
+        t1 = time()
+        if kind == "insert":
+            graph[node].append(neighbour)
+        else:
+            graph[node].remove(neighbour)
+        parents = bfsTree(graph, 0)
+        fullTime += time() - t1
+
+        # both should agree on every distance after every update
+        assert {node: len(treePath(parents, node)) - 1 for node in parents} == dynamic.distances
+
+    print("{} updates on a graph with {} nodes".format(numUpdates, numNodes))
+    print("Full recomputation: {:8.3f}s".format(fullTime))
+    print("Dynamic repair:     {:8.3f}s ({} nodes touched)".format(dynamicTime, repaired))
@@ -0,0 +1,29 @@
+import random
+from time import time
+from search import GridGraph, bfsPath
+
+
+if __name__ == "__main__":
+
+    # the grid world from "00 - Hello Search": 7 columns, 4 rows, and these cells blocked
+    grid = GridGraph(7, 4, blocked=[4, 5, 6, 11, 12, 13, 14, 17, 20, 21, 22])
+
+    # it generates exactly the hand-written adjacency lists
+    tree = [grid[node] for node in grid]
+    print("State 10 can move to {}".format(tree[10]))
+    print("Shortest path from 0 to 27: {}".format(bfsPath(grid, 0, 27)))
+
+    # a big map only stores one byte per cell
+    size = 1000
+    random.seed(0)
+    grid = GridGraph(size, size)
+    for i in range(size * size // 5):
+        grid.setBlocked(random.randrange(size * size))
+    grid.setBlocked(0, False)
+    grid.setBlocked(size * size - 1, False)
+
+    print("A {}x{} map takes {:.1f} MB".format(size, size, grid.blocked.nbytes / 1e6))
+
+    t1 = time()
+    path = bfsPath(grid, 0, size * size - 1)
+    print("Corner to corner in {} moves, found in {:.2f}s".format(len(path) - 1, time() - t1))
@@ -0,0 +1,24 @@
+from search import depthLimitedSearch, iterativeDeepeningSearch
+
+
+if __name__ == "__main__":
+
+    # simple search space, represented by a dictionary
+    graph = {
+        "A": ["B", "C", "E"],
+        "B": ["A", "D", "E"],
+        "C": ["A", "F", "G"],
+        "D": ["B", "E"],
+        "E": ["A", "B", "D"],
+        "F": ["C"],
+        "G": ["C"]
+    }
+
+    print("Depth limited to 3 moves: {}".format(depthLimitedSearch(graph, "G", "D", limit=3)))
+    print("Iterative deepening: {}".format(iterativeDeepeningSearch(graph, "G", "D")))
+
+    # an infinite implicit search space: from any number you can add 1 or double it
+    def moves(number):
+        return [number + 1, number * 2]
+
+    print("Fewest moves from 1 to 100: {}".format(iterativeDeepeningSearch(moves, 1, 100)))
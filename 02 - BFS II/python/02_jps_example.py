@@ -0,0 +1,47 @@
+import random
+from time import time
+from search import GridGraph, bfsPath, gridAStar, jumpPointSearch
+
+
+if __name__ == "__main__":
+
+    # the grid world from "00 - Hello Search", from the start state 0 to the goal state 27
+    grid = GridGraph(7, 4, blocked=[4, 5, 6, 11, 12, 13, 14, 17, 20, 21, 22])
+
+    print("A*:  {} (cost {:.3f})".format(*gridAStar(grid, 0, 27)))
+    print("JPS: {} (cost {:.3f})".format(*jumpPointSearch(grid, 0, 27)))
+
+    # float rounding in the octile heuristic reopens nodes on this map, and
+    # the path has to come back through them
+    maze = GridGraph(13, 13, blocked=[1, 4, 15, 21, 23, 24, 27, 28, 31, 32, 42, 43, 44, 53, 59, 62, 63, 72, 75,
+                                      78, 82, 86, 92, 96, 101, 103, 112, 117, 124, 130, 131, 136, 140, 141, 147,
+                                      148, 151, 154, 158, 161])
+    path, cost = gridAStar(maze, 123, 50)
+    assert path[0] == 123 and path[-1] == 50
+    assert abs(cost - jumpPointSearch(maze, 123, 50)[1]) < 1e-9
+
+    # a mostly open map with some rectangular walls
+    size = 500
+    random.seed(0)
+    grid = GridGraph(size, size)
+    for i in range(60):
+        x, y = random.randrange(size - 50), random.randrange(size - 50)
+        horizontal = random.random() < 0.5
+        for j in range(50):
+            grid.setBlocked(grid.node(x + j, y) if horizontal else grid.node(x, y + j))
+    start, goal = grid.node(1, 1), grid.node(size - 2, size - 2)
+
+    print("{:4} | {:>10} | {:>8}".format("", "cost", "time"))
+    print("=" * 28)
+    for name, fn in [("BFS", bfsPath), ("A*", gridAStar), ("JPS", jumpPointSearch)]:
+        t1 = time()
+        result = fn(grid, start, goal)
+        elapsed = time() - t1
+
+        # BFS only counts moves, so work out the cost of its path
+        if name == "BFS":
+            path = result
+            cost = sum(1 if abs(a - b) in (1, size) else 2 ** 0.5 for a, b in zip(path, path[1:]))
+        else:
+            path, cost = result
+        print("{:4} | {:10.3f} | {:8.3f}".format(name, cost, elapsed))
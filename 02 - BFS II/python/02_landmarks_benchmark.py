@@ -0,0 +1,37 @@
+import random
+from time import time
+from search import Landmarks, SearchStats, bestPath, roadGraph
+
+
+def randomGraph(numNodes, degree, seed=0):
+    """A random directed graph with random weights, where no geometry helps"""
+    rng = random.Random(seed)
+    return {i: [(rng.randrange(numNodes), rng.randint(1, 10)) for _ in range(degree)] for i in range(numNodes)}
+
+
+def compare(name, graph, numQueries=50, count=8):
+    """Runs the same queries with Dijkstra and with ALT, printing the totals"""
+
+    t1 = time()
+    landmarks = Landmarks(graph, count=count)
+    print("{}: picked {} landmarks in {:.2f}s".format(name, len(landmarks.landmarks), time() - t1))
+
+    rng = random.Random(1)
+    nodes = list(graph)
+    queries = [(rng.choice(nodes), rng.choice(nodes)) for i in range(numQueries)]
+
+    for label, heuristic in [("Dijkstra", None), ("ALT", landmarks.heuristic)]:
+        stats = SearchStats(label)
+        costs = [bestPath(graph, start, goal, heuristic, stats)[1] for start, goal in queries]
+        print("  {:<9} {:>9} nodes expanded, {:.2f}s".format(label, stats.nodesExpanded, stats.wallTime))
+
+        # both have to find the same costs
+        if heuristic is None:
+            expected = costs
+        else:
+            assert costs == expected
+
+
+if __name__ == "__main__":
+    compare("Road grid 150x150", roadGraph(150, 150, seed=0))
+    compare("Random graph, 20000 nodes", randomGraph(20000, 4))
@@ -0,0 +1,44 @@
+import os
+import tempfile
+from time import time
+import numpy as np
+from search import bfsPath, loadEdgeList
+
+
+if __name__ == "__main__":
+
+    # write a random edge list with a million edges, twice: once with
+    # integer ids and once with string names
+    rng = np.random.default_rng(0)
+    numNodes, numEdges = 200000, 1000000
+    sources = rng.integers(0, numNodes, numEdges)
+    targets = rng.integers(0, numNodes, numEdges)
+    weights = rng.integers(1, 10, numEdges)
+
+    folder = tempfile.mkdtemp()
+    intPath = os.path.join(folder, "edges.txt")
+    namePath = os.path.join(folder, "edges.csv")
+    np.savetxt(intPath, np.column_stack([sources, targets, weights]), fmt="%d")
+    with open(namePath, "w") as f:
+        f.write("source,target\n")
+        for a, b in zip(sources, targets):
+            f.write("user{},user{}\n".format(a, b))
+
+    size = os.path.getsize(intPath) / 1e6
+    t1 = time()
+    graph = loadEdgeList(intPath, weighted=True, intNames=True)
+    elapsed = time() - t1
+    print("Integer ids:  {:.1f}MB in {:.2f}s ({:.0f}MB/s), {}".format(size, elapsed, size / elapsed, graph))
+
+    size = os.path.getsize(namePath) / 1e6
+    t1 = time()
+    graph = loadEdgeList(namePath, delimiter=",", skipRows=1)
+    elapsed = time() - t1
+    print("String names: {:.1f}MB in {:.2f}s ({:.0f}MB/s), {}".format(size, elapsed, size / elapsed, graph))
+
+    # the loaded graph works with the usual search functions
+    print(bfsPath(graph, "user0", "user1"))
+
+    os.remove(intPath)
+    os.remove(namePath)
+    os.rmdir(folder)
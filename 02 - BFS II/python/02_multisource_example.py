@@ -0,0 +1,24 @@
+from time import time
+import numpy as np
+from search import bfsLevels, multiSourceBfs, powerLawGraph
+
+
+if __name__ == "__main__":
+
+    # a small-world graph, where the traversals from different sources
+    # quickly run into each other
+    graph = powerLawGraph(200000, degree=8, seed=0)
+    sources = list(range(0, 200000, 400))
+
+    t1 = time()
+    single = np.array([bfsLevels(graph, source) for source in sources])
+    print("One BFS per source: {:.2f}s".format(time() - t1))
+
+    for chunk in [64, 256]:
+        t1 = time()
+        distances = multiSourceBfs(graph, sources, chunk=chunk)
+        print("Bit-parallel, {} sources per batch: {:.2f}s".format(chunk, time() - t1))
+        assert (distances == single).all()
+
+    print("{} x {} distance matrix, mean distance {:.2f}".format(
+        distances.shape[0], distances.shape[1], distances[distances >= 0].mean()))
@@ -0,0 +1,51 @@
+import os
+import tempfile
+from search import DistanceOracle, VersionedGraph, bfsShortestPathCSR, CSRGraph
+
+
+# the grid world from "00 - Hello Search", state 0 is the start and 27 the goal
+tree = [
+    [1, 7, 8], [0, 2, 7, 8, 9], [1, 3, 8, 9, 10], [2, 9, 10], [], [], [],
+    [0, 1, 8, 15], [0, 1, 2, 7, 9, 15, 16], [1, 2, 3, 8, 10, 15, 16], [2, 3, 9, 16, 18], [], [], [],
+    [], [7, 8, 9, 16, 23], [8, 9, 10, 15, 23, 24], [], [10, 19, 24, 25, 26], [18, 25, 26, 27], [],
+    [], [], [15, 16, 24], [16, 18, 23, 25], [18, 19, 24, 26], [18, 19, 25, 27], [19, 26],
+]
+
+
+if __name__ == "__main__":
+
+    # wrap the grid so the oracle can see when it changes
+    grid = VersionedGraph(enumerate(tree))
+    oracle = DistanceOracle(grid, workers=2)
+
+    print("Shortest path from 0 to 27: {} ({} moves)".format(
+        oracle.shortestPath(0, 27), oracle.distance(0, 27)))
+
+    # block the route through state 18, the oracle rebuilds on the next query
+    grid.removeEdge(10, 18)
+    grid.removeEdge(24, 18)
+    print("...and after closing 10-18 and 24-18: {}".format(oracle.shortestPath(0, 27)))
+
+    # the letter graph from "01 - BFS I"
+    graph = VersionedGraph({
+        "A": ["B", "C", "E"],
+        "B": ["A", "D", "E"],
+        "C": ["A", "F", "G"],
+        "D": ["B", "E"],
+        "E": ["A", "B", "D"],
+        "F": ["C"],
+        "G": ["C"]
+    })
+
+    # save the tables, and load them back without running any BFS
+    path = os.path.join(tempfile.mkdtemp(), "letters.npz")
+    DistanceOracle(graph).save(path)
+    oracle = DistanceOracle.load(path, graph)
+
+    # every query should agree with a fresh search
+    csr = CSRGraph.fromDict(graph)
+    for start in graph:
+        for goal in graph:
+            assert len(oracle.shortestPath(start, goal)) == len(bfsShortestPathCSR(csr, start, goal))
+
+    print("Shortest path between nodes \"G\" and \"D\": {}".format(oracle.shortestPath("G", "D")))
@@ -2,6 +2,10 @@
 Q1) Can you change the implementation to return all possible paths to the goal (rather than the shortest)?
 """
 
+from collections import deque
+from search import bestPath, kShortestPaths
+
+
 def bfsAllPaths(graph, start, goal):
     """Finds all paths between 2 nodes in a graph using BFS
 
@@ -70,88 +74,113 @@ def bfsAllPaths(graph, start, goal):
     # we couldn't find the goal... :(
     return solutions
 
-"""
-Q3) Can you find the path with the lowest cumulative weight?
-"""
 
-def bfsBestPath(graph, start, goal):
-    """Finds the best path (lowest weight) between 2 nodes in a graph using BFS
+def bfsAllPathsIter(graph, start, goal, maxDepth=None, maxCount=None):
+    """Yields the same paths as bfsAllPaths, one at a time as they are found
 
     Args:
-        graph (dict): Search space represented by a weighted graph
+        graph (dict): Search space represented by a graph
         start (str): Starting state
         goal (str): Goal state
+        maxDepth (int): Ignore paths with more edges than this
+        maxCount (int): Stop after yielding this many paths
 
-    Returns:
-        path (list): List of the states that bring you from the start to
-            the goal state, in the best way possible
+    Yields:
+        path (list): A path that brings you from the start to the goal state
     """
 
-    # set up a path list
-    path = [(start, 0)]
+    # stop straight away if no paths are wanted
+    if maxCount is not None and maxCount <= 0:
+        return
 
-    # return a simple path if start is the goal
+    # yield a simple path if start is the goal
     if start == goal:
-        return path
+        yield [start]
+        return
 
-    # keep track of all solutions
-    solutions = []
+    # keep track of how many paths we have handed out
+    found = 0
 
-    # list to keep track of all visited nodes
-    explored = []
+    # set to keep track of all visited nodes
+    explored = set()
 
     # the FIFO queue
-    queue = []
+    queue = deque()
 
     # add the first path to the queue
-    queue.append(path)
+    queue.append([start])
 
     # keep looping until there are no nodes still to be checked
     while len(queue) > 0:
 
         # pop first item from queue (FIFO)
-        path = queue.pop(0)
+        path = queue.popleft()
 
         # retrieve the last node from the path list
-        node = path[-1][0]
+        node = path[-1]
 
         # check if the node has already been explored
-        if node not in explored:
+        if node in explored:
+            continue
+        explored.add(node)
+
+        # paths through this node would be too long
+        if maxDepth is not None and len(path) > maxDepth:
+            continue
+
+        # go through all neighbour nodes
+        for neighbour in graph.get(node, []):
+            path1 = path + [neighbour]
+
+            if neighbour == goal:
+                # hand the path to the caller, who may never ask for the next one
+                yield path1
+                found += 1
+                if maxCount is not None and found >= maxCount:
+                    return
+            else:
+                # push it onto the queue for further exploration
+                queue.append(path1)
 
-            # add node to list of checked nodes
-            explored.append(node)
+"""
+Q3) Can you find the path with the lowest cumulative weight?
+"""
 
-            # get neighbours if node is present, otherwise default to empty list
-            neighbours = graph.get(node, [])
+def bfsBestPath(graph, start, goal):
+    """Finds the best path (lowest weight) between 2 nodes in a graph
 
-            # go through all neighbour nodes
-            for neighbour in neighbours:
-                # make a copy of the current path
-                path1 = path[:]
+    Collecting every path and summing the weights afterwards is exponential in
+    the worst case, and the explored list can prune away the cheapest path.
+    Instead, we let Dijkstra's algorithm always expand the cheapest path first.
 
-                # add this neighbour to the path
-                path1.append(neighbour)
+    Args:
+        graph (dict): Search space represented by a weighted graph
+        start (str): Starting state
+        goal (str): Goal state
 
-                # append path to solutions if neighbour is goal
-                if neighbour[0] == goal:
-                    solutions.append(path1)
-                else:
-                    # push it onto the queue for further exploration
-                    queue.append(path1)
+    Returns:
+        path (list): List of the (state, weight) tuples that bring you from the
+            start to the goal state, in the best way possible
+    """
 
-    # find the best path by summing the weights:
-    bestPath = solutions[0]
-    bestCost = sum([x[1] for x in bestPath])
+    # return a simple path if start is the goal
+    if start == goal:
+        return [(start, 0)]
 
-    for i in range(1, len(solutions)):
-        path = solutions[i]
-        cost = sum([x[1] for x in path])
-        if cost < bestCost:
-            bestCost = cost
-            bestPath = path
+    # find the cheapest path with a priority queue
+    nodes, cost = bestPath(graph, start, goal)
 
     # we couldn't find the goal... :(
-    return bestPath
+    if nodes is None:
+        return None
+
+    # pair every state with the weight of the edge that led to it
+    path = [(start, 0)]
+    for previous, node in zip(nodes, nodes[1:]):
+        weight = min(w for n, w in graph.get(previous, []) if n == node)
+        path.append((node, weight))
+
+    return path
 
 if __name__ == "__main__":
 
@@ -169,6 +198,9 @@ if __name__ == "__main__":
     result = bfsAllPaths(graph, "G", "D")
     print("Here's all the paths between nodes \"G\" and \"D\": {}".format(result))
 
+    for path in bfsAllPathsIter(graph, "G", "D", maxCount=1):
+        print("Here's the first path found between nodes \"G\" and \"D\": {}".format(path))
+
     """
     Q2) Can you add weights to the edges of our graph?
         I've implemented this using tuples. The second item is the weight of the edge.
@@ -187,3 +219,6 @@ if __name__ == "__main__":
 
     result = bfsBestPath(weightedGraph, "G", "D")
     print("Here's the best path between nodes \"G\" and \"D\": {}".format(result))
+
+    for path, cost in kShortestPaths(weightedGraph, "G", "D", 3):
+        print("...one of the 3 best paths, with cost {}: {}".format(cost, path))
@@ -0,0 +1,42 @@
+import sys
+from search import CSRGraph, SearchStats, bestPath, bfsCSR, bfsPath, dfsCSR, iterativeDeepeningSearch
+
+
+if __name__ == "__main__":
+
+    # simple search space, represented by a dictionary
+    graph = {
+        "A": ["B", "C", "E"],
+        "B": ["A", "D", "E"],
+        "C": ["A", "F", "G"],
+        "D": ["B", "E"],
+        "E": ["A", "B", "D"],
+        "F": ["C"],
+        "G": ["C"]
+    }
+
+    weightedGraph = {
+        "A": [("B", 1), ("C", 1), ("E", 1)],
+        "B": [("A", 1), ("D", 2), ("E", 1)],
+        "C": [("A", 1), ("F", 1), ("G", 1)],
+        "D": [("B", 2), ("E", 1)],
+        "E": [("A", 1), ("B", 1), ("D", 1)],
+        "F": [("C", 1)],
+        "G": [("C", 1)]
+    }
+
+    csr = CSRGraph.fromDict(graph)
+
+    searches = [
+        ("BFS G-D", bfsPath, (graph, "G", "D")),
+        ("IDDFS G-D", iterativeDeepeningSearch, (graph, "G", "D")),
+        ("Dijkstra G-D", bestPath, (weightedGraph, "G", "D")),
+        ("BFS from A", bfsCSR, (csr, "A")),
+        ("DFS from A", dfsCSR, (csr, "A")),
+    ]
+
+    # print one JSON line per search
+    for name, search, args in searches:
+        stats = SearchStats(name)
+        search(*args, stats=stats)
+        stats.writeJSONL(sys.stdout)
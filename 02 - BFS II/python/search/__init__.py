@@ -0,0 +1,24 @@
+from .csr import *
+from .traversal import *
+from .weighted import *
+from .versioned import *
+from .oracle import *
+from .grid import *
+from .gridsearch import *
+from .batch import *
+from .components import *
+from .depth import *
+from .binary import *
+from .dynamic import *
+from .stats import *
+from .generators import *
+from .tutorials import *
+from .kshortest import *
+from .counting import *
+from .asyncsearch import *
+from .beam import *
+from .multisource import *
+from .loader import *
+from .cache import *
+from .contraction import *
+from .landmarks import *
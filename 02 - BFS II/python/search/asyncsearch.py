@@ -0,0 +1,228 @@
+import asyncio
+import heapq
+import random
+from collections import OrderedDict
+from itertools import count
+from .traversal import treePath
+
+
+class AsyncNeighbours(object):
+    """Neighbour lookups through an async fetch function, e.g. a call to a
+    lookup service. At most `concurrency` fetches are in flight at once,
+    results are kept in an LRU cache, and two lookups of the same node while
+    a fetch is in flight share that fetch.
+    """
+
+    def __init__(self, fetch, concurrency=16, cacheSize=100000):
+        """Constructor for the AsyncNeighbours
+
+        Args:
+            fetch (function): async fetch(node) returning the node's neighbours
+            concurrency (int): The most fetches to have in flight at once
+            cacheSize (int): How many nodes to remember, or None for no limit
+        """
+        self.fetch = fetch
+        self.concurrency = concurrency
+        self.cacheSize = cacheSize
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._pending = {}
+        self._semaphore = None
+
+    async def get(self, node):
+        """Returns the neighbours of a node, fetching them if they aren't cached
+
+        Args:
+            node (str): The node
+
+        Returns:
+            neighbours (list): The node's neighbours
+        """
+        if node in self.cache:
+            self.hits += 1
+            self.cache.move_to_end(node)
+            return self.cache[node]
+
+        # someone is already fetching this node, so wait for their answer
+        task = self._pending.get(node)
+        if task is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+            # the fetch runs in its own task, so a caller that gets cancelled
+            # only stops waiting, and doesn't cancel everyone else's answer
+            task = asyncio.ensure_future(self._fetch(node))
+            task.add_done_callback(_retrieve)
+            self._pending[node] = task
+
+        return await asyncio.shield(task)
+
+    async def _fetch(self, node):
+        """Fetches the neighbours of a node and caches them"""
+
+        # the semaphore has to be made inside the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        try:
+            async with self._semaphore:
+                neighbours = await self.fetch(node)
+        finally:
+            del self._pending[node]
+
+        self.cache[node] = neighbours
+        if self.cacheSize is not None and len(self.cache) > self.cacheSize:
+            self.cache.popitem(last=False)
+        return neighbours
+
+    async def getMany(self, nodes):
+        """Fetches the neighbours of several nodes concurrently
+
+        Args:
+            nodes (list): The nodes
+
+        Returns:
+            neighbours (list): The neighbours of each node, in the same order
+        """
+        return await asyncio.gather(*[self.get(node) for node in nodes])
+
+
+async def asyncBfsPath(neighbours, start, goal):
+    """Finds the shortest path between 2 nodes with a BFS that goes one level
+    at a time, fetching the neighbours of the whole frontier concurrently
+
+    Args:
+        neighbours (AsyncNeighbours): Where the neighbours come from
+        start (str): Starting state
+        goal (str): Goal state
+
+    Returns:
+        path (list): The nodes from start to goal, or None if the goal can't
+            be reached
+    """
+
+    parents = {start: None}
+    frontier = [start]
+
+    while frontier and goal not in parents:
+        # one round trip for the whole level instead of one per node
+        levels = await neighbours.getMany(frontier)
+
+        following = []
+        for node, nodeNeighbours in zip(frontier, levels):
+            for neighbour in nodeNeighbours:
+                if neighbour not in parents:
+                    parents[neighbour] = node
+                    following.append(neighbour)
+        frontier = following
+
+    if goal not in parents:
+        return None
+    return treePath(parents, goal)
+
+
+async def asyncBestPath(neighbours, start, goal, heuristic=None, lookahead=16):
+    """Finds the lowest cost path between 2 nodes with Dijkstra, or A* if a
+    heuristic is given, over weighted (neighbour, weight) lists. Nodes are
+    still expanded one at a time in cost order, so the result is optimal, but
+    the neighbours of the next `lookahead` nodes on the queue are fetched
+    concurrently before each expansion
+
+    Args:
+        neighbours (AsyncNeighbours): Where the weighted neighbours come from
+        start (str): Starting state
+        goal (str): Goal state
+        heuristic (function): Optional heuristic(node, goal) estimate
+        lookahead (int): How many queued nodes to prefetch
+
+    Returns:
+        tuple (path, cost): The nodes from start to goal and the path cost,
+            or (None, inf) if the goal can't be reached
+    """
+
+    def estimate(node):
+        return heuristic(node, goal) if heuristic else 0
+
+    costs = {start: 0}
+    parents = {start: None}
+    closed = set()
+    tie = count()
+    queue = [(estimate(start), next(tie), start)]
+
+    while queue:
+        # when the next node needs a round trip, also fetch the best few open
+        # nodes that aren't cached yet, since we'll probably expand them soon
+        if queue[0][2] not in neighbours.cache:
+            upcoming = heapq.nsmallest(lookahead, (entry for entry in queue
+                                                   if entry[2] not in closed and entry[2] not in neighbours.cache))
+            await neighbours.getMany(list(dict.fromkeys(node for _, _, node in upcoming)))
+
+        _, _, node = heapq.heappop(queue)
+        if node in closed:
+            continue
+        closed.add(node)
+
+        if node == goal:
+            return treePath(parents, goal), costs[goal]
+
+        for neighbour, weight in await neighbours.get(node):
+            newCost = costs[node] + weight
+            if neighbour not in costs or newCost < costs[neighbour]:
+                costs[neighbour] = newCost
+                parents[neighbour] = node
+                # reopen the node in case the heuristic is inconsistent
+                closed.discard(neighbour)
+                heapq.heappush(queue, (newCost + estimate(neighbour), next(tie), neighbour))
+
+    # we couldn't find the goal... :(
+    return None, float("inf")
+
+
+class LatencyService(object):
+    """An in-process stand-in for a neighbour lookup service. Each fetch waits
+    for a while before answering from a local graph, and the service counts
+    its calls and the most calls it had in flight at once.
+    """
+
+    def __init__(self, graph, latency=0.01, jitter=0.0, seed=None):
+        """Constructor for the LatencyService
+
+        Args:
+            graph (dict): The graph to answer from
+            latency (float): Seconds each fetch takes
+            jitter (float): Up to this many extra seconds, picked at random
+            seed (int): Seed for the jitter
+        """
+        self.graph = graph
+        self.latency = latency
+        self.jitter = jitter
+        self.random = random.Random(seed)
+        self.calls = 0
+        self.inFlight = 0
+        self.peakInFlight = 0
+
+    async def fetch(self, node):
+        """Returns the neighbours of a node after the simulated delay
+
+        Args:
+            node (str): The node
+
+        Returns:
+            neighbours (list): The node's neighbours
+        """
+        self.calls += 1
+        self.inFlight += 1
+        self.peakInFlight = max(self.peakInFlight, self.inFlight)
+        try:
+            await asyncio.sleep(self.latency + self.random.uniform(0, self.jitter))
+            return list(self.graph.get(node, []))
+        finally:
+            self.inFlight -= 1
+
+
+def _retrieve(task):
+    """Marks a failed fetch's exception as seen, since nobody may be waiting"""
+    if not task.cancelled():
+        task.exception()
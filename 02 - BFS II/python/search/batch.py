@@ -0,0 +1,82 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from .traversal import treePath
+
+
+def batchShortestPaths(graph, queries, workers=1):
+    """Answers many shortest path queries, running one BFS per distinct start
+    node and reading every goal for that start off the same BFS tree
+
+    Args:
+        graph (dict): Search space represented by a graph
+        queries (list): (start, goal) pairs
+        workers (int): How many processes to spread the start nodes over
+
+    Returns:
+        paths (list): The shortest path for each query, in the same order,
+            or None where the goal can't be reached
+    """
+
+    # group the goals by their start node
+    groups = {}
+    for start, goal in queries:
+        groups.setdefault(start, set()).add(goal)
+
+    answers = {}
+    if workers > 1 and len(groups) > 1:
+        # the graph is sent to each worker once, not once per start node
+        starts = list(groups)
+        with ProcessPoolExecutor(workers, initializer=_setGraph, initargs=(graph,)) as pool:
+            tasks = [(start, groups[start]) for start in starts]
+            chunksize = max(1, len(tasks) // (workers * 4))
+            for start, paths in zip(starts, pool.map(_answerTask, tasks, chunksize=chunksize)):
+                answers[start] = paths
+    else:
+        for start, goals in groups.items():
+            answers[start] = shortestPathsFrom(graph, start, goals)
+
+    return [answers[start][goal] for start, goal in queries]
+
+
+def shortestPathsFrom(graph, start, goals):
+    """Finds shortest paths from one start node to several goals with a
+    single BFS, which stops once every goal has been found
+
+    Args:
+        graph (dict): Search space represented by a graph
+        start (str): Starting state
+        goals (set): Goal states
+
+    Returns:
+        paths (dict): The shortest path to each goal, or None if it can't
+            be reached
+    """
+
+    parents = {start: None}
+    remaining = set(goals)
+    remaining.discard(start)
+
+    queue = deque([start])
+    while queue and remaining:
+        node = queue.popleft()
+        for neighbour in graph.get(node, []):
+            if neighbour not in parents:
+                parents[neighbour] = node
+                remaining.discard(neighbour)
+                queue.append(neighbour)
+
+    return {goal: treePath(parents, goal) if goal in parents else None for goal in goals}
+
+
+# the graph shared by every task in a worker process
+_graph = None
+
+
+def _setGraph(graph):
+    global _graph
+    _graph = graph
+
+
+def _answerTask(task):
+    start, goals = task
+    return shortestPathsFrom(_graph, start, goals)
@@ -0,0 +1,63 @@
+from .traversal import treePath
+
+
+def beamSearch(graph, start, goal, heuristic, width=100, maxNodes=None):
+    """Searches level by level like BFS, but only keeps the `width` nodes of
+    each level that the heuristic ranks best. A level is generated in full
+    before it is pruned, so it briefly holds up to `width` times the degree
+    nodes, and the parents of every kept level stay in memory, which is
+    O(depth * width) in total. maxNodes is the only hard cap on how many
+    nodes the search stores; once it is reached no new nodes are kept.
+
+    A shortest path is only guaranteed if nothing was pruned before the
+    goal's level. The answer "unreachable" is only guaranteed if nothing was
+    pruned at all.
+
+    Args:
+        graph (dict): Search space represented by a graph
+        start (str): Starting state
+        goal (str): Goal state
+        heuristic (function): heuristic(node, goal), lower is more promising
+        width (int): The most nodes to keep per level
+        maxNodes (int): The most nodes to store in total, or None for no cap
+
+    Returns:
+        tuple (path, optimal): The nodes from start to goal, or None if the
+            goal wasn't found, and whether that answer is guaranteed correct
+    """
+
+    if start == goal:
+        return [start], True
+
+    parents = {start: None}
+    frontier = [start]
+    pruned = False
+
+    while frontier:
+        # only pruning on earlier levels can hide a shorter path to the goal
+        complete = not pruned
+
+        # generate the next level, in the same order as BFS
+        following = []
+        for node in frontier:
+            for neighbour in graph.get(node, []):
+                if neighbour not in parents and (maxNodes is None or len(parents) < maxNodes):
+                    parents[neighbour] = node
+                    following.append(neighbour)
+                elif neighbour not in parents:
+                    pruned = True
+
+        if goal in parents:
+            return treePath(parents, goal), complete
+
+        # keep the best nodes. The sort is stable, so ties keep the BFS order
+        if len(following) > width:
+            pruned = True
+            following.sort(key=lambda n: heuristic(n, goal))
+            for node in following[width:]:
+                del parents[node]
+            following = following[:width]
+
+        frontier = following
+
+    return None, not pruned
@@ -0,0 +1,220 @@
+import struct
+import numpy as np
+from .csr import CSRGraph
+
+
+# the file starts with a fixed size header:
+#   magic, format version, flags, nodes, edges, name table bytes, id size
+MAGIC = b"CSRGRAPH"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQQQI28x")
+
+# header flags
+WEIGHTED = 1
+INT_NAMES = 2
+
+
+def saveGraph(graph, path):
+    """Writes a graph to a binary CSR file that loadGraph can memory-map.
+
+    After the header, the file holds these sections, each starting on an
+    8 byte boundary:
+        name offsets (int64, n+1)  and  name bytes (utf-8), or int64 names
+        sorted name order (int64, n), used to look names up by binary search
+        offsets (int64, n+1)
+        neighbours (int32 or int64, m)
+        weights (float64, m), if the graph is weighted
+
+    Args:
+        graph (CSRGraph): The graph, or a dict graph which is converted first
+        path (str): The file to write
+
+    Raises:
+        TypeError: If the node names aren't all strings or all integers
+    """
+
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.fromDict(graph)
+
+    n = len(graph)
+    names = list(graph.names)
+    flags = WEIGHTED if graph.weights is not None else 0
+
+    if all(isinstance(name, (int, np.integer)) and not isinstance(name, bool) for name in names):
+        # integer names (like grid cells) are stored as a plain array
+        flags |= INT_NAMES
+        nameArray = np.array(names, dtype=np.int64)
+        order = np.argsort(nameArray, kind="stable")
+        nameSection = [nameArray]
+        nameBytes = 0
+    elif all(isinstance(name, str) for name in names):
+        encoded = [name.encode("utf-8") for name in names]
+        nameOffsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum([len(e) for e in encoded], out=nameOffsets[1:])
+        blob = b"".join(encoded)
+        order = np.array(sorted(range(n), key=encoded.__getitem__), dtype=np.int64)
+        nameSection = [nameOffsets, blob]
+        nameBytes = len(blob)
+    else:
+        # anything else would come back as a string, or clash with another name
+        raise TypeError("saveGraph needs node names that are all strings or all integers")
+
+    neighbours = np.asarray(graph.neighbours)
+    idSize = neighbours.dtype.itemsize
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, flags, n, graph.numEdges, nameBytes, idSize))
+        for section in nameSection + [order, np.asarray(graph.offsets, dtype=np.int64), neighbours]:
+            _writeAligned(f, section)
+        if graph.weights is not None:
+            _writeAligned(f, np.asarray(graph.weights, dtype=np.float64))
+
+
+def loadGraph(path, mmap=True):
+    """Opens a graph written by saveGraph. With mmap, nothing is read up front:
+    the arrays are memory-mapped, so loading takes milliseconds whatever the
+    size, and processes that open the same file share its pages
+
+    Args:
+        path (str): The file to read
+        mmap (bool): Memory-map the arrays, rather than reading them in
+
+    Returns:
+        (CSRGraph): The graph
+    """
+
+    with open(path, "rb") as f:
+        magic, version, flags, n, m, nameBytes, idSize = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC:
+        raise ValueError("{} is not a CSR graph file".format(path))
+    if version != VERSION:
+        raise ValueError("{} has unsupported format version {}".format(path, version))
+
+    position = [HEADER.size]
+
+    def section(dtype, count):
+        dtype = np.dtype(dtype)
+        if mmap and count > 0:
+            array = np.memmap(path, dtype=dtype, mode="r", offset=position[0], shape=(count,))
+        else:
+            with open(path, "rb") as f:
+                f.seek(position[0])
+                array = np.fromfile(f, dtype=dtype, count=count)
+        position[0] += _aligned(dtype.itemsize * count)
+        return array
+
+    if flags & INT_NAMES:
+        names = IntNameTable(section(np.int64, n))
+    else:
+        nameOffsets = section(np.int64, n + 1)
+        names = NameTable(nameOffsets, section(np.uint8, nameBytes))
+
+    order = section(np.int64, n)
+    offsets = section(np.int64, n + 1)
+    neighbours = section(np.int32 if idSize == 4 else np.int64, m)
+    weights = section(np.float64, m) if flags & WEIGHTED else None
+
+    return CSRGraph(names, offsets, neighbours, weights, index=NameIndex(names, order))
+
+
+class NameTable(object):
+    """A read-only list of node names, decoded from a memory-mapped utf-8
+    blob only when they are asked for
+    """
+
+    def __init__(self, offsets, blob):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def encoded(self, i):
+        """Returns the utf-8 bytes of name i"""
+        return self.blob[self.offsets[i]:self.offsets[i + 1]].tobytes()
+
+    def __getitem__(self, i):
+        return self.encoded(i).decode("utf-8")
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def key(self, name):
+        """Returns the value names are sorted by"""
+        if not isinstance(name, str):
+            raise TypeError(name)
+        return name.encode("utf-8")
+
+
+class IntNameTable(object):
+    """A read-only list of integer node names over a memory-mapped array"""
+
+    def __init__(self, values):
+        self.values = values
+
+    def __len__(self):
+        return len(self.values)
+
+    def encoded(self, i):
+        return int(self.values[i])
+
+    def __getitem__(self, i):
+        return int(self.values[i])
+
+    def __iter__(self):
+        return iter(self.values.tolist())
+
+    def key(self, name):
+        if not isinstance(name, (int, np.integer)):
+            raise TypeError(name)
+        return int(name)
+
+
+class NameIndex(object):
+    """Maps names to ids by binary search over the sorted name order stored in
+    the file, so no dict of every name has to be built when a graph is loaded
+    """
+
+    def __init__(self, names, order):
+        self.names = names
+        self.order = order
+
+    def get(self, name, default=None):
+        try:
+            key = self.names.key(name)
+        except (TypeError, UnicodeError):
+            return default
+
+        low, high = 0, len(self.order)
+        while low < high:
+            middle = (low + high) // 2
+            i = int(self.order[middle])
+            value = self.names.encoded(i)
+            if value == key:
+                return i
+            if value < key:
+                low = middle + 1
+            else:
+                high = middle
+        return default
+
+    def __getitem__(self, name):
+        i = self.get(name)
+        if i is None:
+            raise KeyError(name)
+        return i
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+
+def _aligned(size):
+    """Rounds a section size up to the next multiple of 8 bytes"""
+    return (size + 7) // 8 * 8
+
+
+def _writeAligned(f, data):
+    """Writes a section, padding it to a multiple of 8 bytes"""
+    data = data if isinstance(data, bytes) else np.ascontiguousarray(data).tobytes()
+    f.write(data)
+    f.write(b"\0" * (_aligned(len(data)) - len(data)))
@@ -0,0 +1,94 @@
+from collections import OrderedDict
+
+
+class SearchCache(object):
+    """Remembers the answers of a search function for one graph, e.g.
+    bfsShortestPath or bfsBestPath, so repeated (start, goal) queries are
+    answered without searching.
+
+    The graph needs a version that goes up whenever it changes, like a
+    VersionedGraph or a GridGraph. The cache is emptied the first time it is
+    used after the version has changed, so it never returns a stale answer.
+    The least recently used answers are dropped once there are maxSize.
+    """
+
+    def __init__(self, graph, search, maxSize=1024):
+        """Constructor for the SearchCache
+
+        Args:
+            graph (VersionedGraph): The graph to search
+            search (function): search(graph, start, goal, ...) to cache
+            maxSize (int): The most answers to keep
+        """
+
+        if getattr(graph, "version", None) is None:
+            raise TypeError("SearchCache needs a graph with a version, e.g. a VersionedGraph")
+
+        self.graph = graph
+        self.search = search
+        self.maxSize = maxSize
+        self.version = graph.version
+        self.answers = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __call__(self, start, goal, *args):
+        """Answers a query from the cache, or by running the search
+
+        Args:
+            start (str): Starting state
+            goal (str): Goal state
+            *args: Any other arguments for the search function
+
+        Returns:
+            The search function's answer
+        """
+
+        # throw everything away if the graph changed since the last query
+        if self.graph.version != self.version:
+            self.answers.clear()
+            self.version = self.graph.version
+            self.invalidations += 1
+
+        key = (start, goal) + args
+        if key in self.answers:
+            self.hits += 1
+            self.answers.move_to_end(key)
+            return _copy(self.answers[key])
+
+        self.misses += 1
+        answer = self.search(self.graph, start, goal, *args)
+        self.answers[key] = answer
+        if len(self.answers) > self.maxSize:
+            self.answers.popitem(last=False)
+        return _copy(answer)
+
+    def clear(self):
+        """Forgets every answer and resets the counters"""
+        self.answers.clear()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def hitRate(self):
+        """The fraction of queries answered from the cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self):
+        return len(self.answers)
+
+    def __repr__(self):
+        return "SearchCache(size={}/{}, hits={}, misses={}, invalidations={})".format(
+            len(self), self.maxSize, self.hits, self.misses, self.invalidations)
+
+
+def _copy(answer):
+    """Copies the lists in an answer, so callers can't change the cached one"""
+    if isinstance(answer, list):
+        return list(answer)
+    if isinstance(answer, tuple):
+        return tuple(list(x) if isinstance(x, list) else x for x in answer)
+    return answer
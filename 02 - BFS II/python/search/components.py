@@ -0,0 +1,165 @@
+from array import array
+import numpy as np
+
+
+class UnionFind(object):
+    """A disjoint-set forest over the ids 0..n-1, with path compression and
+    union by rank, so each operation takes close to constant time
+    """
+
+    def __init__(self, n=0):
+        """Constructor for the UnionFind. Every id starts in its own set
+
+        Args:
+            n (int): The number of ids
+        """
+        self.parents = array("q", range(n))
+        self.ranks = array("b", bytes(n))
+        self.count = n
+
+    def __len__(self):
+        return len(self.parents)
+
+    def add(self):
+        """Adds a new id in its own set
+
+        Returns:
+            (int): The new id
+        """
+        i = len(self.parents)
+        self.parents.append(i)
+        self.ranks.append(0)
+        self.count += 1
+        return i
+
+    def find(self, i):
+        """Returns the representative id of the set containing i"""
+        parents = self.parents
+
+        # find the root...
+        root = i
+        while parents[root] != root:
+            root = parents[root]
+
+        # ...then point everything on the way straight at it
+        while parents[i] != root:
+            parents[i], i = root, parents[i]
+
+        return root
+
+    def union(self, a, b):
+        """Merges the sets containing a and b
+
+        Returns:
+            (bool): True if they were in different sets
+        """
+        a = self.find(a)
+        b = self.find(b)
+        if a == b:
+            return False
+
+        # hang the shallower tree under the deeper one
+        ranks = self.ranks
+        if ranks[a] < ranks[b]:
+            a, b = b, a
+        self.parents[b] = a
+        if ranks[a] == ranks[b]:
+            ranks[a] += 1
+
+        self.count -= 1
+        return True
+
+    def labels(self):
+        """Labels every id with its set, numbering the sets 0..count-1 in
+        order of their smallest id
+
+        Returns:
+            labels (ndarray): The set label of every id
+        """
+        roots = np.fromiter((self.find(i) for i in range(len(self))), dtype=np.int64, count=len(self))
+        _, first, inverse = np.unique(roots, return_index=True, return_inverse=True)
+
+        # np.unique numbers the roots in sorted order, renumber them by first appearance
+        order = np.argsort(np.argsort(first))
+        return order[inverse].astype(np.int32)
+
+
+def connectedComponents(graph):
+    """Labels every node of a CSRGraph with its connected component in one
+    pass over the edges. Edges are treated as undirected, so for a directed
+    graph these are the weakly connected components
+
+    Args:
+        graph (CSRGraph): Search space represented by a CSR graph
+
+    Returns:
+        labels (ndarray): The component of every node id, numbered 0..k-1
+    """
+
+    sets = UnionFind(len(graph))
+    offsets = memoryview(graph.offsets)
+    neighbours = memoryview(graph.neighbours)
+
+    for node in range(len(graph)):
+        for neighbour in neighbours[offsets[node]:offsets[node + 1]]:
+            sets.union(node, neighbour)
+
+    return sets.labels()
+
+
+class IncrementalComponents(object):
+    """Connected components of a graph that only ever gains edges. Adding an
+    edge merges two components, without revisiting the rest of the graph
+    """
+
+    def __init__(self, graph=None):
+        """Constructor for IncrementalComponents
+
+        Args:
+            graph (dict): An optional graph to start from
+        """
+        self.sets = UnionFind()
+        self.names = []
+        self.index = {}
+
+        if graph is not None:
+            for node, neighbours in graph.items():
+                self.addNode(node)
+                for neighbour in neighbours:
+                    self.addEdge(node, neighbour)
+
+    def addNode(self, node):
+        """Adds a node in its own component, if it isn't there already
+
+        Returns:
+            (int): The node's id
+        """
+        i = self.index.get(node)
+        if i is None:
+            i = self.index[node] = self.sets.add()
+            self.names.append(node)
+        return i
+
+    def addEdge(self, a, b):
+        """Adds an edge, merging the components of its two ends
+
+        Returns:
+            (bool): True if two components were merged
+        """
+        return self.sets.union(self.addNode(a), self.addNode(b))
+
+    def connected(self, a, b):
+        """Returns True if there is a path between a and b"""
+        return self.sets.find(self.index[a]) == self.sets.find(self.index[b])
+
+    @property
+    def numComponents(self):
+        return self.sets.count
+
+    def labels(self):
+        """Labels every node with its component, see UnionFind.labels
+
+        Returns:
+            labels (ndarray): The component of every node, aligned with names
+        """
+        return self.sets.labels()
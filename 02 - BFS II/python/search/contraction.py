@@ -0,0 +1,322 @@
+import heapq
+import numpy as np
+from .csr import decodeNames, encodeNames, internNames
+
+
+class ContractionHierarchy(object):
+    """A contraction hierarchy for fast lowest cost path queries on a static
+    weighted graph.
+
+    Preprocessing removes ("contracts") the nodes one at a time, least
+    important first. When a node is removed, a shortcut edge is added between
+    each pair of its neighbours whose only shortest path ran through it. Each
+    node then only keeps its edges to more important nodes. A query is a
+    bidirectional Dijkstra that only ever goes upwards in importance, which
+    explores a tiny part of the graph.
+    """
+
+    def __init__(self, graph, witnessLimit=200):
+        """Constructor for the ContractionHierarchy. Preprocesses the graph
+        straight away
+
+        Args:
+            graph (dict): Search space represented by a weighted graph, whose
+                neighbours are (name, weight) tuples
+            witnessLimit (int): How many nodes a witness search may settle
+                before giving up and adding the shortcut anyway. Lower is
+                faster to build, but adds more shortcuts
+        """
+
+        # intern the node names, including nodes that only appear as neighbours
+        names, index = internNames(graph, weighted=True)
+        self.names = names
+        self.index = index
+
+        n = len(names)
+        self.rank, up, down = _contract(graph, index, n, witnessLimit)
+
+        # the upward edges of each node, and the downward edges into it, as CSR arrays
+        self.upOffsets, self.upTargets, self.upWeights, self.upMiddles = _toArrays(up)
+        self.downOffsets, self.downSources, self.downWeights, self.downMiddles = _toArrays(down)
+        self._prepare()
+
+    def _prepare(self):
+        """Builds the lists the queries walk over from the CSR arrays"""
+
+        n = len(self.names)
+        self._up = _toLists(self.upOffsets, self.upTargets, self.upWeights, n)
+        self._down = _toLists(self.downOffsets, self.downSources, self.downWeights, n)
+
+        # the node each shortcut skips over, used to unpack paths
+        self._middle = {}
+        for offsets, others, middles, upward in ((self.upOffsets, self.upTargets, self.upMiddles, True),
+                                                 (self.downOffsets, self.downSources, self.downMiddles, False)):
+            nodes = np.repeat(np.arange(n), np.diff(offsets))
+            shortcuts = np.flatnonzero(middles >= 0)
+            for node, other, middle in zip(nodes[shortcuts].tolist(), others[shortcuts].tolist(),
+                                           middles[shortcuts].tolist()):
+                self._middle[(node, other) if upward else (other, node)] = middle
+
+    @property
+    def numShortcuts(self):
+        """How many shortcut edges preprocessing added"""
+        return int((self.upMiddles >= 0).sum() + (self.downMiddles >= 0).sum())
+
+    def distance(self, start, goal):
+        """Returns the cost of the lowest cost path between 2 nodes
+
+        Args:
+            start (str): Starting state
+            goal (str): Goal state
+
+        Returns:
+            (float): The path cost, or inf if the goal can't be reached
+        """
+        cost, _, _, _ = self._search(self.index[start], self.index[goal])
+        return cost
+
+    def shortestPath(self, start, goal):
+        """Finds the lowest cost path between 2 nodes, with the shortcuts
+        unpacked back into the original edges
+
+        Args:
+            start (str): Starting state
+            goal (str): Goal state
+
+        Returns:
+            tuple (path, cost): The nodes from start to goal and the path cost,
+                or (None, inf) if the goal can't be reached
+        """
+
+        s, g = self.index[start], self.index[goal]
+        cost, meeting, forward, backward = self._search(s, g)
+        if meeting is None:
+            return None, float("inf")
+
+        # the upward path from the start to the meeting node...
+        hops = [meeting]
+        while forward[hops[-1]] is not None:
+            hops.append(forward[hops[-1]])
+        hops.reverse()
+
+        # ...then down to the goal
+        while backward[hops[-1]] is not None:
+            hops.append(backward[hops[-1]])
+
+        return [self.names[i] for i in self._unpack(hops)], cost
+
+    def _search(self, start, goal):
+        """Runs the bidirectional upward Dijkstra between 2 node ids"""
+
+        up, down = self._up, self._down
+        costs = ({start: 0}, {goal: 0})
+        parents = ({start: None}, {goal: None})
+        queues = ([(0, start)], [(0, goal)])
+        best = float("inf")
+        meeting = start if start == goal else None
+
+        while queues[0] or queues[1]:
+            # expand whichever side has the cheaper node next
+            side = 0 if queues[0] and (not queues[1] or queues[0][0][0] <= queues[1][0][0]) else 1
+            queue = queues[side]
+
+            # neither side can find anything cheaper than what we've got
+            if queue[0][0] >= best:
+                break
+
+            cost, node = heapq.heappop(queue)
+            if cost > costs[side][node]:
+                continue
+
+            # the two searches have met
+            other = costs[1 - side].get(node)
+            if other is not None and cost + other < best:
+                best = cost + other
+                meeting = node
+
+            # stall on demand: if a higher node reaches this one more cheaply
+            # through an edge going the other way, this cost isn't the lowest,
+            # so there's no point going further up from here
+            mine, myParents = costs[side], parents[side]
+            if any(mine.get(higher, best) + weight < cost for higher, weight in (down if side == 0 else up)[node]):
+                continue
+
+            for neighbour, weight in (up if side == 0 else down)[node]:
+                newCost = cost + weight
+                if newCost < mine.get(neighbour, best):
+                    mine[neighbour] = newCost
+                    myParents[neighbour] = node
+                    heapq.heappush(queue, (newCost, neighbour))
+
+        return best, meeting, parents[0], parents[1]
+
+    def _unpack(self, hops):
+        """Replaces every shortcut in a list of node ids with the edges it skips"""
+        middle = self._middle
+        path = [hops[0]]
+        stack = list(zip(hops[-2::-1], hops[:0:-1]))
+        while stack:
+            a, b = stack.pop()
+            m = middle.get((a, b))
+            if m is None:
+                path.append(b)
+            else:
+                # the second half goes on the stack first, so it comes off last
+                stack.append((m, b))
+                stack.append((a, m))
+        return path
+
+    def save(self, path):
+        """Saves the hierarchy to a .npz file
+
+        Args:
+            path (str): The file to write
+
+        Raises:
+            TypeError: If a node name isn't a string, a number or a tuple
+        """
+        np.savez(path, names=np.array(encodeNames(self.names)), rank=self.rank,
+                 upOffsets=self.upOffsets, upTargets=self.upTargets,
+                 upWeights=self.upWeights, upMiddles=self.upMiddles,
+                 downOffsets=self.downOffsets, downSources=self.downSources,
+                 downWeights=self.downWeights, downMiddles=self.downMiddles)
+
+    @classmethod
+    def load(cls, path):
+        """Loads a hierarchy saved with save, without preprocessing again
+
+        Args:
+            path (str): The file to read
+
+        Returns:
+            (ContractionHierarchy): The hierarchy
+        """
+        with np.load(path) as data:
+            hierarchy = cls.__new__(cls)
+            hierarchy.names = decodeNames(str(data["names"]))
+            hierarchy.index = {name: i for i, name in enumerate(hierarchy.names)}
+            for key in ["rank", "upOffsets", "upTargets", "upWeights", "upMiddles",
+                        "downOffsets", "downSources", "downWeights", "downMiddles"]:
+                setattr(hierarchy, key, data[key])
+        hierarchy._prepare()
+        return hierarchy
+
+    def __repr__(self):
+        return "ContractionHierarchy(nodes={}, edges={}, shortcuts={})".format(
+            len(self.names), len(self.upTargets) + len(self.downSources), self.numShortcuts)
+
+
+def _contract(graph, index, n, witnessLimit):
+    """Contracts every node, returning the ranks and each node's upward edges"""
+
+    # the cheapest edge between each pair of nodes that are still in the graph
+    inf = float("inf")
+    outgoing = [{} for _ in range(n)]
+    incoming = [{} for _ in range(n)]
+    for name, neighbours in graph.items():
+        u = index[name]
+        for neighbour, weight in neighbours:
+            v = index[neighbour]
+            if u != v and weight < outgoing[u].get(v, inf):
+                outgoing[u][v] = weight
+                incoming[v][u] = weight
+
+    middle = {}
+    removedNeighbours = [0] * n
+
+    def witnessCosts(source, avoid, limit, targets):
+        """A Dijkstra from source that doesn't go through avoid, stopping once
+        every target is settled, the costs pass limit or witnessLimit nodes
+        have been settled. Every cost found belongs to a real path"""
+        costs = {source: 0}
+        queue = [(0, source)]
+        remaining = set(targets)
+        settled = 0
+        while queue and remaining and settled < witnessLimit:
+            cost, node = heapq.heappop(queue)
+            if cost > costs[node]:
+                continue
+            if cost > limit:
+                break
+            settled += 1
+            remaining.discard(node)
+            for neighbour, weight in outgoing[node].items():
+                if neighbour != avoid and cost + weight < costs.get(neighbour, inf):
+                    costs[neighbour] = cost + weight
+                    heapq.heappush(queue, (cost + weight, neighbour))
+        return costs
+
+    def shortcuts(v):
+        """The shortcuts needed to remove v: one for each in-out pair of
+        neighbours with no other path at most as cheap as the one through v"""
+        needed = []
+        for u, w1 in incoming[v].items():
+            targets = {x: w1 + w2 for x, w2 in outgoing[v].items() if x != u}
+            if not targets:
+                continue
+            costs = witnessCosts(u, v, max(targets.values()), targets)
+            needed += [(u, x, cost) for x, cost in targets.items() if costs.get(x, inf) > cost]
+        return needed
+
+    def priority(v, needed):
+        # the edge difference, plus a term that spreads contraction evenly
+        return len(needed) - len(incoming[v]) - len(outgoing[v]) + removedNeighbours[v]
+
+    queue = [(priority(v, shortcuts(v)), v) for v in range(n)]
+    heapq.heapify(queue)
+
+    rank = np.zeros(n, dtype=np.int32)
+    up = [None] * n
+    down = [None] * n
+    order = 0
+
+    while queue:
+        _, v = heapq.heappop(queue)
+
+        # priorities go stale as the graph changes, so check this one is still the lowest
+        needed = shortcuts(v)
+        current = priority(v, needed)
+        if queue and current > queue[0][0]:
+            heapq.heappush(queue, (current, v))
+            continue
+
+        for u, x, cost in needed:
+            if cost < outgoing[u].get(x, inf):
+                outgoing[u][x] = cost
+                incoming[x][u] = cost
+                middle[(u, x)] = v
+
+        # every neighbour left in the graph ranks above v
+        up[v] = [(x, w, middle.get((v, x), -1)) for x, w in outgoing[v].items()]
+        down[v] = [(u, w, middle.get((u, v), -1)) for u, w in incoming[v].items()]
+        for x in outgoing[v]:
+            del incoming[x][v]
+            removedNeighbours[x] += 1
+        for u in incoming[v]:
+            del outgoing[u][v]
+            removedNeighbours[u] += 1
+        outgoing[v] = {}
+        incoming[v] = {}
+
+        rank[v] = order
+        order += 1
+
+    return rank, up, down
+
+
+def _toArrays(edges):
+    """Packs per-node (other, weight, middle) lists into CSR arrays"""
+    offsets = np.zeros(len(edges) + 1, dtype=np.int64)
+    np.cumsum([len(e) for e in edges], out=offsets[1:])
+    flat = [edge for nodeEdges in edges for edge in nodeEdges]
+    others = np.array([e[0] for e in flat], dtype=np.int64)
+    weights = np.array([e[1] for e in flat], dtype=np.float64)
+    middles = np.array([e[2] for e in flat], dtype=np.int64)
+    return offsets, others, weights, middles
+
+
+def _toLists(offsets, others, weights, n):
+    """Unpacks CSR arrays into per-node lists of (other, weight) tuples"""
+    offsets = offsets.tolist()
+    pairs = list(zip(others.tolist(), weights.tolist()))
+    return [pairs[offsets[i]:offsets[i + 1]] for i in range(n)]
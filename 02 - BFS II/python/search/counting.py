@@ -0,0 +1,184 @@
+from collections import deque
+import numpy as np
+from .csr import internNames
+
+
+def countShortestPaths(graph, start, goal, modulus=None):
+    """Counts the shortest paths between 2 nodes without listing them, with a
+    BFS where each node adds its count to the neighbours one level down
+
+    Args:
+        graph (dict): Search space represented by a graph
+        start (str): Starting state
+        goal (str): Goal state
+        modulus (int): If given, the count is taken modulo this number
+
+    Returns:
+        tuple (distance, count): The shortest path length and how many
+            shortest paths there are, or (None, 0) if the goal can't be reached
+    """
+
+    distances = {start: 0}
+    counts = {start: 1}
+    queue = deque([start])
+
+    while queue:
+        node = queue.popleft()
+
+        # every path into the goal's level has been counted once we get past it
+        if goal in distances and distances[node] >= distances[goal]:
+            break
+
+        distance = distances[node] + 1
+        for neighbour in graph.get(node, []):
+            if neighbour not in distances:
+                distances[neighbour] = distance
+                counts[neighbour] = 0
+                queue.append(neighbour)
+
+            # only edges going one level down are on shortest paths
+            if distances[neighbour] == distance:
+                counts[neighbour] += counts[node]
+                if modulus is not None:
+                    counts[neighbour] %= modulus
+
+    if goal not in distances:
+        return None, 0
+    return distances[goal], counts[goal]
+
+
+def countWalks(graph, start, goal, maxLength, modulus=None):
+    """Counts the walks of at most maxLength edges between 2 nodes, by pushing
+    a vector of counts along every edge maxLength times. Walks may visit a node
+    more than once (counting only simple paths is #P-hard in general graphs)
+
+    Args:
+        graph (dict): Search space represented by a graph
+        start (str): Starting state
+        goal (str): Goal state
+        maxLength (int): The longest walk to count, in edges
+        modulus (int): If given, the count is taken modulo this number
+
+    Returns:
+        (int): The number of walks
+    """
+
+    current = {start: 1}
+    total = 1 if start == goal else 0
+
+    for _ in range(maxLength):
+        following = {}
+        for node, ways in current.items():
+            for neighbour in graph.get(node, []):
+                following[neighbour] = following.get(neighbour, 0) + ways
+        if modulus is not None:
+            following = {node: ways % modulus for node, ways in following.items()}
+
+        current = following
+        total += current.get(goal, 0)
+
+    return total if modulus is None else total % modulus
+
+
+def countWalksMatrix(graph, start, goal, maxLength, modulus=None):
+    """Counts the same walks as countWalks, using repeated squaring of the
+    block matrix [[A, I], [0, I]], where A is the adjacency matrix. This takes
+    O(n^3 log L) time, so it suits small graphs with very large maxLength
+
+    Args:
+        graph (dict): Search space represented by a graph
+        start (str): Starting state
+        goal (str): Goal state
+        maxLength (int): The longest walk to count, in edges
+        modulus (int): If given, the count is taken modulo this number
+
+    Returns:
+        (int): The number of walks
+    """
+
+    # number the nodes, including ones that only appear as neighbours
+    _, index = internNames(graph)
+    index.setdefault(start, len(index))
+    index.setdefault(goal, len(index))
+    n = len(index)
+
+    # python ints in object arrays never overflow
+    block = np.zeros((2 * n, 2 * n), dtype=object)
+    for node, neighbours in graph.items():
+        for neighbour in neighbours:
+            block[index[node], index[neighbour]] += 1
+    for i in range(n):
+        block[i, n + i] = 1
+        block[n + i, n + i] = 1
+
+    # [x, s] times the block gives [x A, x + s], so after L + 1 steps s holds
+    # the sum of x A^l for l = 0..L
+    vector = np.zeros(2 * n, dtype=object)
+    vector[index[start]] = 1
+    power = maxLength + 1
+    while power:
+        if power & 1:
+            vector = _reduce(vector.dot(block), modulus)
+        block = _reduce(block.dot(block), modulus)
+        power >>= 1
+
+    return int(vector[n + index[goal]])
+
+
+def countDagPaths(graph, start, goal, modulus=None):
+    """Counts every path between 2 nodes of a directed acyclic graph, with one
+    pass over the nodes in topological order
+
+    Args:
+        graph (dict): Search space represented by a directed acyclic graph
+        start (str): Starting state
+        goal (str): Goal state
+        modulus (int): If given, the count is taken modulo this number
+
+    Returns:
+        (int): The number of paths
+
+    Raises:
+        ValueError: If there is a cycle reachable from the start
+    """
+
+    # count the incoming edges of everything reachable from the start
+    incoming = {start: 0}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for neighbour in graph.get(node, []):
+            if neighbour not in incoming:
+                incoming[neighbour] = 0
+                queue.append(neighbour)
+            incoming[neighbour] += 1
+
+    # an edge back into the start closes a cycle through it
+    if incoming[start]:
+        raise ValueError("The graph has a cycle, so the number of paths is infinite")
+
+    # Kahn's algorithm: a node is ready once all its incoming paths are counted.
+    # Nodes on a cycle never get there, so they are never visited
+    counts = {start: 1}
+    ready = deque([start])
+    visited = 0
+    while ready:
+        node = ready.popleft()
+        visited += 1
+        for neighbour in graph.get(node, []):
+            counts[neighbour] = counts.get(neighbour, 0) + counts[node]
+            if modulus is not None:
+                counts[neighbour] %= modulus
+            incoming[neighbour] -= 1
+            if incoming[neighbour] == 0:
+                ready.append(neighbour)
+
+    if visited < len(incoming):
+        raise ValueError("The graph has a cycle, so the number of paths is infinite")
+
+    return counts.get(goal, 0)
+
+
+def _reduce(array, modulus):
+    """Takes every entry modulo the modulus, if there is one"""
+    return array if modulus is None else array % modulus
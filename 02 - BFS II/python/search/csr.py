@@ -0,0 +1,300 @@
+from array import array
+import json
+import numpy as np
+
+
+class CSRGraph(object):
+    """A compact graph stored in compressed sparse row (CSR) form.
+
+    Node names are interned into integer ids. The neighbours of node i are
+    neighbours[offsets[i]:offsets[i+1]], with matching entries in weights
+    if the graph is weighted.
+
+    The class also behaves like the dict graphs used in the tutorials:
+    graph.get(node, []) returns a list of neighbour names (or (name, weight)
+    tuples for a weighted graph), so it can be passed straight to
+    bfsShortestPath, bfsAllPaths, bfsBestPath or bfs_connected_component.
+    """
+
+    def __init__(self, names, offsets, neighbours, weights=None, index=None):
+        """Constructor for the CSRGraph. Usually you want fromDict or fromEdges
+
+        Args:
+            names (list): The node names, indexed by node id
+            offsets (ndarray): Start of each node's neighbours, length n+1
+            neighbours (ndarray): The neighbour ids, length m
+            weights (ndarray): The edge weights, length m, or None
+            index (dict): Maps each name to its id. Built from names if None
+        """
+
+        self.names = names
+        self.offsets = offsets
+        self.neighbours = neighbours
+        self.weights = weights
+
+        # map each name back to its id
+        if index is None:
+            if isinstance(names, range) and names == range(len(names)):
+                # nodes named by their ids don't need a dict at all
+                index = RangeIndex(len(names))
+            else:
+                index = {name: i for i, name in enumerate(names)}
+        self.index = index
+
+    @classmethod
+    def fromEdges(cls, names, sources, targets, weights=None):
+        """Creates a CSRGraph from parallel arrays of edges
+
+        Args:
+            names (list): The node names, indexed by node id. A range keeps
+                the names as plain ids without building a name dict
+            sources (array): The source id of each edge
+            targets (array): The target id of each edge
+            weights (array): The weight of each edge, or None
+
+        Returns:
+            (CSRGraph): The graph
+        """
+
+        n = len(names)
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=_idType(n))
+
+        # count the out-degree of every node, then turn it into offsets
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n), out=offsets[1:])
+
+        # a stable sort keeps each node's neighbours in their original order
+        order = np.argsort(sources, kind="stable")
+        neighbours = targets[order]
+
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64)[order]
+
+        if not isinstance(names, range):
+            names = list(names)
+        return cls(names, offsets, neighbours, weights)
+
+    @classmethod
+    def fromDict(cls, graph, weighted=None):
+        """Creates a CSRGraph from a dict graph, weighted or not
+
+        Args:
+            graph (dict): Search space represented by a graph. Neighbours are
+                either names, or (name, weight) tuples
+            weighted (bool): Whether the neighbours are (name, weight) tuples.
+                It has to be given when the neighbours are tuples, since they
+                could also be tuple node names like grid cells
+
+        Returns:
+            (CSRGraph): The graph
+
+        Raises:
+            ValueError: If weighted is None and some neighbours are tuples
+        """
+
+        # tuples could be weights or node names, so don't guess which
+        if weighted is None:
+            if any(isinstance(x, tuple) for ns in graph.values() for x in ns):
+                raise ValueError("The neighbours are tuples, so pass weighted=True for "
+                                 "(name, weight) pairs or weighted=False for tuple names")
+            weighted = False
+
+        # intern the keys first, so ids follow the dict order, and then the
+        # neighbours that are not keys
+        names, index = internNames(graph, weighted)
+
+        # array buffers hold the edges as machine ints rather than int objects
+        sources = array("q")
+        targets = array("q")
+        weights = array("d") if weighted else None
+        for node, neighbours in graph.items():
+            i = index[node]
+            for neighbour in neighbours:
+                sources.append(i)
+                if weighted:
+                    neighbour, weight = neighbour
+                    weights.append(weight)
+                targets.append(index[neighbour])
+
+        return cls.fromEdges(names, sources, targets, weights)
+
+    @property
+    def numEdges(self):
+        """(int): The number of edges in the graph"""
+        return len(self.neighbours)
+
+    @property
+    def nbytes(self):
+        """(int): Bytes used by the CSR arrays (excluding the name table)"""
+        n = self.offsets.nbytes + self.neighbours.nbytes
+        if self.weights is not None:
+            n += self.weights.nbytes
+        return n
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def keys(self):
+        return list(self.names)
+
+    def __getitem__(self, name):
+        return self.neighbourNames(self.index[name])
+
+    def get(self, name, default=None):
+        """Returns the neighbours of a node, in the same form as dict.get
+
+        Args:
+            name: The node name
+            default: Returned if the node is not in the graph
+
+        Returns:
+            (list): The neighbour names, or (name, weight) tuples if weighted
+        """
+        i = self.index.get(name)
+        if i is None:
+            return default
+        return self.neighbourNames(i)
+
+    def neighbourIds(self, i):
+        """Returns the neighbour ids of node id i
+
+        Args:
+            i (int): The node id
+
+        Returns:
+            (ndarray): View of the neighbour ids
+        """
+        return self.neighbours[self.offsets[i]:self.offsets[i + 1]]
+
+    def neighbourNames(self, i):
+        """Returns the neighbours of node id i as names
+
+        Args:
+            i (int): The node id
+
+        Returns:
+            (list): The neighbour names, or (name, weight) tuples if weighted
+        """
+        start, end = int(self.offsets[i]), int(self.offsets[i + 1])
+        names = self.names
+        neighbours = [names[j] for j in self.neighbours[start:end].tolist()]
+        if self.weights is None:
+            return neighbours
+        return list(zip(neighbours, self.weights[start:end].tolist()))
+
+    def toDict(self):
+        """Converts the graph back into the dict form
+
+        Returns:
+            (dict): Search space represented by a graph
+        """
+        return {name: self.neighbourNames(i) for i, name in enumerate(self.names)}
+
+    def __repr__(self):
+        return "CSRGraph(nodes={}, edges={}, weighted={})".format(
+            len(self), self.numEdges, self.weights is not None)
+
+
+class RangeIndex(object):
+    """The name index of a graph whose nodes are named 0..n-1"""
+
+    def __init__(self, n):
+        self.n = n
+
+    def get(self, name, default=None):
+        if isinstance(name, (int, np.integer)) and 0 <= name < self.n:
+            return int(name)
+        return default
+
+    def __getitem__(self, name):
+        i = self.get(name)
+        if i is None:
+            raise KeyError(name)
+        return i
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+
+def internNames(graph, weighted=False):
+    """Numbers the nodes of a dict graph. The keys come first, so ids follow
+    the dict order, then the nodes that only appear as neighbours
+
+    Args:
+        graph (dict): Search space represented by a graph
+        weighted (bool): Whether the neighbours are (name, weight) tuples
+
+    Returns:
+        tuple (names, index): The name of every id, and the id of every name
+    """
+    names = list(graph.keys())
+    index = {name: i for i, name in enumerate(names)}
+    for neighbours in list(graph.values()):
+        for neighbour in neighbours:
+            if weighted:
+                neighbour = neighbour[0]
+            if neighbour not in index:
+                index[neighbour] = len(names)
+                names.append(neighbour)
+    return names, index
+
+
+def encodeNames(names):
+    """Turns a list of node names into JSON text that decodeNames turns back
+    into the same names. JSON has no tuples, so tuple names like grid cells
+    are written as lists, which can't be node names themselves
+
+    Args:
+        names (list): The node names, made of strings, numbers and tuples
+
+    Returns:
+        (str): The JSON text
+
+    Raises:
+        TypeError: If a name can't be written as JSON
+    """
+    for name in names:
+        _checkName(name)
+    return json.dumps(names)
+
+
+def decodeNames(text):
+    """Reads node names written by encodeNames
+
+    Args:
+        text (str): The JSON text
+
+    Returns:
+        (list): The node names
+    """
+    return [_toTuples(name) for name in json.loads(text)]
+
+
+def _checkName(name):
+    """Raises a TypeError for names that wouldn't come back from JSON the same"""
+    if isinstance(name, tuple):
+        for part in name:
+            _checkName(part)
+    elif name is not None and not isinstance(name, (str, int, float)):
+        raise TypeError("Node name {!r} can't be saved, names must be strings, "
+                        "numbers or tuples of them".format(name))
+
+
+def _toTuples(value):
+    """Turns the lists read back from JSON into tuples again"""
+    if isinstance(value, list):
+        return tuple(_toTuples(x) for x in value)
+    return value
+
+
+def _idType(n):
+    """Picks the smallest integer dtype that can hold n node ids"""
+    return np.int32 if n < 2 ** 31 else np.int64
+
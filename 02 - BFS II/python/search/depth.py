@@ -0,0 +1,130 @@
+from .stats import statsPhase
+
+
+def depthLimitedSearch(graph, start, goal=None, limit=10, isGoal=None, stats=None):
+    """Finds a path from the start to the goal using DFS, never going deeper
+    than a depth limit. Only the current path is kept in memory, so memory
+    grows with the depth, not with the size of the search space
+
+    Args:
+        graph: Search space represented by a graph (anything with a get
+            method), or a function returning the neighbours of a node, for
+            implicit search spaces
+        start (str): Starting state
+        goal (str): Goal state
+        limit (int): The maximum number of edges in the path
+        isGoal (function): Used instead of comparing with goal, if given
+        stats (SearchStats): If given, filled in with counters and timings
+
+    Returns:
+        path (list): List of the states that bring you from the start to
+            the goal state, or None
+    """
+    path, _ = _depthLimited(graph, start, goal, limit, isGoal, stats)
+    return path
+
+
+def iterativeDeepeningSearch(graph, start, goal=None, maxDepth=None, isGoal=None, stats=None):
+    """Finds a shortest path from the start to the goal by running depth
+    limited searches with limits 0, 1, 2, ... until the goal is found. This
+    gives the same path length as BFS, with the memory use of DFS
+
+    Args:
+        graph: Search space represented by a graph (anything with a get
+            method), or a function returning the neighbours of a node
+        start (str): Starting state
+        goal (str): Goal state
+        maxDepth (int): Give up after this depth. Without it, the search runs
+            until it finds the goal or runs out of nodes, which may never
+            happen in an infinite search space
+        isGoal (function): Used instead of comparing with goal, if given
+        stats (SearchStats): If given, filled in with counters and timings,
+            summed over all the depth limited searches
+
+    Returns:
+        path (list): List of the states that bring you from the start to
+            the goal state, in the quickest way possible, or None
+    """
+    limit = 0
+    while maxDepth is None or limit <= maxDepth:
+        path, cutoff = _depthLimited(graph, start, goal, limit, isGoal, stats)
+        if path is not None:
+            return path
+
+        # nothing was cut off, so a deeper search won't find anything new
+        if not cutoff:
+            return None
+
+        limit += 1
+
+    return None
+
+
+# marks the end of a neighbour iterator
+_done = object()
+
+
+def _depthLimited(graph, start, goal, limit, isGoal, stats=None):
+    """Runs a depth limited search. When counting, every node pushed on the
+    path counts as expanded, and the peak queue is the deepest the path got
+
+    Returns:
+        tuple (path, cutoff): The path or None, and whether any branch was cut
+            off by the limit
+    """
+
+    if isGoal is None:
+        isGoal = lambda node: node == goal
+
+    neighboursOf = graph if callable(graph) else (lambda node: graph.get(node, []))
+
+    with statsPhase(stats, "search"):
+        if isGoal(start):
+            return [start], False
+
+        # the current path, and one neighbour iterator per node on it
+        path = [start]
+        onPath = {start}
+        stack = [iter(neighboursOf(start))]
+        cutoff = False
+        if stats is not None:
+            stats.nodesExpanded += 1
+            stats.queued(1)
+
+        while stack:
+            neighbour = next(stack[-1], _done)
+
+            # no neighbours left here, so backtrack
+            if neighbour is _done:
+                stack.pop()
+                onPath.discard(path.pop())
+                continue
+
+            if stats is not None:
+                stats.edgesScanned += 1
+
+            # don't walk round in circles
+            if neighbour in onPath:
+                continue
+
+            # stepping to the neighbour would go past the limit
+            if len(path) > limit:
+                cutoff = True
+                continue
+
+            if isGoal(neighbour):
+                return path + [neighbour], cutoff
+
+            # the neighbour is right on the limit, so we can't go any deeper
+            if len(path) == limit:
+                cutoff = True
+                continue
+
+            path.append(neighbour)
+            onPath.add(neighbour)
+            stack.append(iter(neighboursOf(neighbour)))
+            if stats is not None:
+                stats.nodesExpanded += 1
+                stats.queued(len(path))
+
+        return None, cutoff
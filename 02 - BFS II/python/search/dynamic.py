@@ -0,0 +1,152 @@
+import heapq
+from collections import deque
+from itertools import count
+from .traversal import treePath
+
+
+class DynamicBFS(object):
+    """Single-source BFS distances and parents that are kept up to date as
+    edges are inserted and deleted.
+
+    An insertion only re-searches the nodes that get closer to the source. A
+    deletion only re-searches the part of the BFS tree that hung off the
+    deleted edge, everything else keeps its distance.
+    """
+
+    def __init__(self, graph, source):
+        """Constructor for the DynamicBFS. Copies the graph and runs one BFS
+
+        Args:
+            graph (dict): Search space represented by a graph
+            source (str): The node distances are measured from
+        """
+
+        self.source = source
+
+        # our own copy of the edges, in both directions
+        self.graph = {}
+        self.reverse = {}
+        for node, neighbours in graph.items():
+            self.graph.setdefault(node, [])
+            for neighbour in neighbours:
+                self._link(node, neighbour)
+
+        self.distances = {source: 0}
+        self.parents = {source: None}
+        self._propagate([source])
+
+    def _link(self, node, neighbour):
+        self.graph.setdefault(node, []).append(neighbour)
+        self.graph.setdefault(neighbour, [])
+        self.reverse.setdefault(neighbour, []).append(node)
+
+    def _propagate(self, nodes):
+        """Runs BFS outwards from nodes whose distance just went down, updating
+        any neighbour that this makes closer to the source
+
+        Returns:
+            (int): How many nodes were updated
+        """
+        distances = self.distances
+        parents = self.parents
+        queue = deque(nodes)
+        updated = 0
+
+        while queue:
+            node = queue.popleft()
+            distance = distances[node] + 1
+            for neighbour in self.graph.get(node, []):
+                if distance < distances.get(neighbour, distance + 1):
+                    distances[neighbour] = distance
+                    parents[neighbour] = node
+                    queue.append(neighbour)
+                    updated += 1
+
+        return updated
+
+    def insertEdge(self, node, neighbour):
+        """Adds an edge from node to neighbour and repairs the distances
+
+        Returns:
+            (int): How many nodes changed distance
+        """
+        self._link(node, neighbour)
+
+        distance = self.distances.get(node)
+        if distance is None or distance + 1 >= self.distances.get(neighbour, distance + 2):
+            return 0
+
+        self.distances[neighbour] = distance + 1
+        self.parents[neighbour] = node
+        return 1 + self._propagate([neighbour])
+
+    def deleteEdge(self, node, neighbour):
+        """Removes one edge from node to neighbour and repairs the distances
+
+        Returns:
+            (int): How many nodes had to be re-searched
+        """
+        self.graph[node].remove(neighbour)
+        self.reverse[neighbour].remove(node)
+
+        # nothing changes unless it was a tree edge, with no copy left
+        if self.parents.get(neighbour) != node or neighbour in self.graph[node]:
+            return 0
+
+        distances = self.distances
+        parents = self.parents
+
+        # find the subtree that hung off the deleted edge
+        affected = {neighbour}
+        queue = deque([neighbour])
+        while queue:
+            x = queue.popleft()
+            for y in self.graph[x]:
+                if y not in affected and parents.get(y) == x:
+                    affected.add(y)
+                    queue.append(y)
+
+        for x in affected:
+            del distances[x]
+            del parents[x]
+
+        # each affected node may hang back on from any unaffected in-neighbour.
+        # the counter breaks ties, so nodes never need to be compared
+        tie = count()
+        queue = []
+        for x in affected:
+            for p in self.reverse.get(x, []):
+                if p in distances:
+                    heapq.heappush(queue, (distances[p] + 1, next(tie), x, p))
+
+        # then settle the affected nodes closest first, like Dijkstra with unit weights
+        while queue:
+            distance, _, x, p = heapq.heappop(queue)
+            if x in distances:
+                continue
+            distances[x] = distance
+            parents[x] = p
+            for y in self.graph[x]:
+                if y in affected and y not in distances:
+                    heapq.heappush(queue, (distance + 1, next(tie), y, x))
+
+        # affected nodes that were never settled can no longer be reached
+        return len(affected)
+
+    def distance(self, node):
+        """Returns the number of hops from the source to a node, or None"""
+        return self.distances.get(node)
+
+    def shortestPath(self, node):
+        """Returns a shortest path from the source to a node
+
+        Args:
+            node (str): Goal state
+
+        Returns:
+            path (list): List of the states that bring you from the source
+                to the node, in the quickest way possible, or None
+        """
+        if node not in self.parents:
+            return None
+        return treePath(self.parents, node)
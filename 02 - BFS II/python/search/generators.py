@@ -0,0 +1,94 @@
+import numpy as np
+from .csr import CSRGraph
+
+
+def randomGraph(numNodes, degree=4, seed=None):
+    """Creates a random directed graph where every node has the same number
+    of neighbours, picked uniformly
+
+    Args:
+        numNodes (int): How many nodes to create
+        degree (int): How many neighbours each node gets
+        seed (int): Seed for the random number generator
+
+    Returns:
+        (CSRGraph): The graph, with nodes named 0..numNodes-1
+    """
+    rng = np.random.default_rng(seed)
+    sources = np.repeat(np.arange(numNodes), degree)
+    targets = rng.integers(0, numNodes, numNodes * degree)
+    return CSRGraph.fromEdges(range(numNodes), sources, targets)
+
+
+def gridGraph(width, height):
+    """Creates an open 8-connected grid, numbered like GridGraph, as a CSRGraph
+
+    Args:
+        width (int): Number of columns
+        height (int): Number of rows
+
+    Returns:
+        (CSRGraph): The graph, with cell (x, y) named y * width + x
+    """
+    xs, ys = np.meshgrid(np.arange(width), np.arange(height))
+    xs, ys = xs.ravel(), ys.ravel()
+
+    sources = []
+    targets = []
+    for dx, dy in [(-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1)]:
+        nx, ny = xs + dx, ys + dy
+        inside = (nx >= 0) & (nx < width) & (ny >= 0) & (ny < height)
+        sources.append((ys * width + xs)[inside])
+        targets.append((ny * width + nx)[inside])
+
+    return CSRGraph.fromEdges(range(width * height), np.concatenate(sources), np.concatenate(targets))
+
+
+def roadGraph(width, height, seed=None):
+    """Creates a 4-connected grid with random travel times from 1 to 10, a
+    bit like a street map. Each street has the same time both ways
+
+    Args:
+        width (int): Number of columns
+        height (int): Number of rows
+        seed (int): Seed for the random number generator
+
+    Returns:
+        (dict): The weighted graph, with cell (x, y) named y * width + x and
+            neighbours as (name, weight) tuples
+    """
+    rng = np.random.default_rng(seed)
+    graph = {}
+    for y in range(height):
+        for x in range(width):
+            for dx, dy in [(1, 0), (0, 1)]:
+                if x + dx < width and y + dy < height:
+                    a, b = y * width + x, (y + dy) * width + x + dx
+                    weight = int(rng.integers(1, 11))
+                    graph.setdefault(a, []).append((b, weight))
+                    graph.setdefault(b, []).append((a, weight))
+    return graph
+
+
+def powerLawGraph(numNodes, degree=4, exponent=2.5, seed=None):
+    """Creates a random graph whose degrees follow a power law, using the
+    Chung-Lu model: each edge end is picked with probability proportional to
+    a node weight w_i ~ i^(-1/(exponent-1)). A few hubs get most of the edges
+
+    Args:
+        numNodes (int): How many nodes to create
+        degree (int): The average number of neighbours
+        exponent (float): The power law exponent, usually between 2 and 3
+        seed (int): Seed for the random number generator
+
+    Returns:
+        (CSRGraph): The graph, with nodes named 0..numNodes-1. Edges go both ways
+    """
+    rng = np.random.default_rng(seed)
+    weights = np.arange(1, numNodes + 1, dtype=np.float64) ** (-1.0 / (exponent - 1))
+    weights /= weights.sum()
+
+    numEdges = numNodes * degree // 2
+    a = rng.choice(numNodes, numEdges, p=weights)
+    b = rng.choice(numNodes, numEdges, p=weights)
+    return CSRGraph.fromEdges(range(numNodes), np.concatenate([a, b]), np.concatenate([b, a]))
@@ -0,0 +1,154 @@
+import numpy as np
+
+
+# the 8 moves in the order that keeps neighbour ids ascending, like the
+# hand-written grid in "00 - Hello Search"
+MOVES = [(-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1)]
+
+
+class GridGraph(object):
+    """An implicit grid graph, where neighbours are worked out when asked for.
+
+    Cells are numbered row by row, so cell (x, y) is node y * width + x, just
+    like the states of the grid in "00 - Hello Search". Only a bitmap of the
+    blocked cells is stored. Blocked cells have no neighbours, and open cells
+    are connected to their open 8 (or 4) neighbours.
+
+    graph.get(node, []) and graph[node] work like the dict and list graphs,
+    so the grid can be passed straight to the BFS functions.
+    """
+
+    def __init__(self, width, height, blocked=None, diagonal=True):
+        """Constructor for the GridGraph
+
+        Args:
+            width (int): Number of columns
+            height (int): Number of rows
+            blocked: Either a (height, width) boolean array, or a list of
+                blocked node ids
+            diagonal (bool): Whether diagonal moves are allowed
+        """
+
+        self.width = width
+        self.height = height
+        self.diagonal = diagonal
+        self.version = 0
+
+        if blocked is None:
+            cells = np.zeros((height, width), dtype=bool)
+        elif isinstance(blocked, np.ndarray):
+            cells = np.array(blocked, dtype=bool).reshape(height, width)
+        else:
+            cells = np.zeros((height, width), dtype=bool)
+            cells.flat[list(blocked)] = True
+        self._blocked = cells
+
+        # a byte view of the same memory, which is much faster to index from Python
+        self._cells = memoryview(cells.reshape(-1).view(np.uint8))
+
+        self._moves = MOVES if diagonal else [m for m in MOVES if 0 in m]
+
+        # away from the edges, every move is just a fixed offset in node ids
+        self._steps = [dy * width + dx for dx, dy in self._moves]
+
+    def __len__(self):
+        return self.width * self.height
+
+    def __contains__(self, node):
+        return isinstance(node, (int, np.integer)) and 0 <= node < len(self)
+
+    def __iter__(self):
+        return iter(range(len(self)))
+
+    def keys(self):
+        return range(len(self))
+
+    def values(self):
+        return (self[node] for node in self)
+
+    def items(self):
+        return ((node, self[node]) for node in self)
+
+    def node(self, x, y):
+        """Returns the node id of cell (x, y)"""
+        return y * self.width + x
+
+    def coordinates(self, node):
+        """Returns the (x, y) cell of a node id"""
+        return node % self.width, node // self.width
+
+    @property
+    def blocked(self):
+        """(ndarray): A read-only (height, width) view of the blocked cells.
+        Change cells with setBlocked, so the version goes up"""
+        view = self._blocked.view()
+        view.flags.writeable = False
+        return view
+
+    def isBlocked(self, node):
+        return bool(self._cells[node])
+
+    def setBlocked(self, node, blocked=True):
+        """Blocks or opens a cell
+
+        Args:
+            node (int): The node id
+            blocked (bool): Whether the cell should be blocked
+        """
+        self._cells[node] = 1 if blocked else 0
+        self.version += 1
+
+    def __getitem__(self, node):
+        if node not in self:
+            raise KeyError(node)
+        return self.neighbours(node)
+
+    def get(self, node, default=None):
+        """Returns the neighbours of a node, in the same form as dict.get
+
+        Args:
+            node (int): The node id
+            default: Returned if the node is outside the grid
+
+        Returns:
+            (list): The open neighbour ids
+        """
+        try:
+            if 0 <= node < self.width * self.height:
+                return self.neighbours(node)
+        except TypeError:
+            pass
+        return default
+
+    def neighbours(self, node):
+        """Generates the open neighbours of a cell
+
+        Args:
+            node (int): The node id
+
+        Returns:
+            (list): The open neighbour ids, in ascending order
+        """
+        cells = self._cells
+        if cells[node]:
+            return []
+
+        width, height = self.width, self.height
+        y, x = divmod(node, width)
+
+        # fast path for cells that aren't on the edge of the map
+        if 0 < x < width - 1 and 0 < y < height - 1:
+            return [node + step for step in self._steps if not cells[node + step]]
+
+        neighbours = []
+        for dx, dy in self._moves:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height:
+                neighbour = ny * width + nx
+                if not cells[neighbour]:
+                    neighbours.append(neighbour)
+        return neighbours
+
+    def __repr__(self):
+        return "GridGraph(width={}, height={}, blocked={})".format(
+            self.width, self.height, int(self.blocked.sum()))
@@ -0,0 +1,231 @@
+import heapq
+import math
+from itertools import count
+from .traversal import treePath
+from .weighted import bestPath
+
+
+SQRT2 = math.sqrt(2)
+
+
+def manhattanHeuristic(grid):
+    """Creates the Manhattan distance heuristic for a 4-connected grid
+
+    Args:
+        grid (GridGraph): The grid
+
+    Returns:
+        (function): heuristic(node, goal)
+    """
+    width = grid.width
+
+    def heuristic(node, goal):
+        y1, x1 = divmod(node, width)
+        y2, x2 = divmod(goal, width)
+        return abs(x1 - x2) + abs(y1 - y2)
+
+    return heuristic
+
+
+def octileHeuristic(grid):
+    """Creates the octile distance heuristic for an 8-connected grid, where
+    straight moves cost 1 and diagonal moves cost sqrt(2)
+
+    Args:
+        grid (GridGraph): The grid
+
+    Returns:
+        (function): heuristic(node, goal)
+    """
+    width = grid.width
+
+    def heuristic(node, goal):
+        y1, x1 = divmod(node, width)
+        y2, x2 = divmod(goal, width)
+        dx, dy = abs(x1 - x2), abs(y1 - y2)
+        return max(dx, dy) + (SQRT2 - 1) * min(dx, dy)
+
+    return heuristic
+
+
+class WeightedGrid(object):
+    """A view of a GridGraph with move costs, in the (node, weight) tuple
+    format of the weighted search functions. Straight moves cost 1 and
+    diagonal moves cost sqrt(2)
+    """
+
+    def __init__(self, grid):
+        self.grid = grid
+
+    def get(self, node, default=None):
+        neighbours = self.grid.get(node)
+        if neighbours is None:
+            return default
+
+        width = self.grid.width
+        x = node % width
+        return [(n, 1 if n % width == x or n // width == node // width else SQRT2) for n in neighbours]
+
+
+def gridAStar(grid, start, goal, stats=None):
+    """Finds the lowest cost path between 2 cells with A*, using the octile
+    heuristic on 8-connected grids and Manhattan on 4-connected ones
+
+    Args:
+        grid (GridGraph): The grid
+        start (int): Starting cell
+        goal (int): Goal cell
+        stats (SearchStats): If given, filled in with counters and timings
+
+    Returns:
+        tuple (path, cost): The cells from start to goal and the path cost,
+            or (None, inf) if the goal can't be reached
+    """
+    heuristic = octileHeuristic(grid) if grid.diagonal else manhattanHeuristic(grid)
+    return bestPath(WeightedGrid(grid), start, goal, heuristic, stats)
+
+
+def jumpPointSearch(grid, start, goal):
+    """Finds the lowest cost path between 2 cells of an 8-connected grid with
+    Jump Point Search. It is A* that only puts "jump points" on the open list:
+    cells where the path might have to turn. Runs of symmetric moves across
+    open space are skipped over instead of expanded one cell at a time.
+
+    Args:
+        grid (GridGraph): An 8-connected grid
+        start (int): Starting cell
+        goal (int): Goal cell
+
+    Returns:
+        tuple (path, cost): The cells from start to goal and the path cost,
+            or (None, inf) if the goal can't be reached
+    """
+
+    if not grid.diagonal:
+        raise ValueError("Jump Point Search needs a grid with diagonal moves")
+
+    if grid.isBlocked(start) or grid.isBlocked(goal):
+        return None, float("inf")
+    if start == goal:
+        return [start], 0
+
+    width, height = grid.width, grid.height
+    cells = grid._cells
+    heuristic = octileHeuristic(grid)
+    gx, gy = goal % width, goal // width
+
+    def walkable(x, y):
+        return 0 <= x < width and 0 <= y < height and not cells[y * width + x]
+
+    def jump(x, y, dx, dy):
+        """Moves from (x, y) in direction (dx, dy) until it hits a wall, the
+        goal, or a cell with a forced neighbour, which is the jump point"""
+        while True:
+            x += dx
+            y += dy
+            if not walkable(x, y):
+                return None
+            if x == gx and y == gy:
+                return x, y
+
+            if dx and dy:
+                # diagonal: a blocked cell behind us may force a turn
+                if (not walkable(x - dx, y) and walkable(x - dx, y + dy)) or \
+                        (not walkable(x, y - dy) and walkable(x + dx, y - dy)):
+                    return x, y
+
+                # we also stop if a straight jump from here finds anything
+                if jump(x, y, dx, 0) is not None or jump(x, y, 0, dy) is not None:
+                    return x, y
+            elif dx:
+                if (not walkable(x, y + 1) and walkable(x + dx, y + 1)) or \
+                        (not walkable(x, y - 1) and walkable(x + dx, y - 1)):
+                    return x, y
+            else:
+                if (not walkable(x + 1, y) and walkable(x + 1, y + dy)) or \
+                        (not walkable(x - 1, y) and walkable(x - 1, y + dy)):
+                    return x, y
+
+    def directions(x, y, parent):
+        """The directions worth searching from (x, y), given where we came from"""
+        if parent is None:
+            return [(dx, dy) for dx, dy in ((-1, -1), (0, -1), (1, -1), (-1, 0),
+                                            (1, 0), (-1, 1), (0, 1), (1, 1))
+                    if walkable(x + dx, y + dy)]
+
+        px, py = parent % width, parent // width
+        dx = (x > px) - (x < px)
+        dy = (y > py) - (y < py)
+        result = []
+
+        if dx and dy:
+            # natural neighbours carry on diagonally, or along either axis
+            result += [(dx, dy), (dx, 0), (0, dy)]
+            # forced neighbours appear around blocked cells beside us
+            if not walkable(x - dx, y):
+                result.append((-dx, dy))
+            if not walkable(x, y - dy):
+                result.append((dx, -dy))
+        elif dx:
+            result.append((dx, 0))
+            if not walkable(x, y + 1):
+                result.append((dx, 1))
+            if not walkable(x, y - 1):
+                result.append((dx, -1))
+        else:
+            result.append((0, dy))
+            if not walkable(x + 1, y):
+                result.append((1, dy))
+            if not walkable(x - 1, y):
+                result.append((-1, dy))
+
+        return [(ddx, ddy) for ddx, ddy in result if walkable(x + ddx, y + ddy)]
+
+    costs = {start: 0}
+    parents = {start: None}
+    closed = set()
+    tie = count()
+    queue = [(heuristic(start, goal), next(tie), start)]
+
+    while queue:
+        _, _, node = heapq.heappop(queue)
+        if node in closed:
+            continue
+        closed.add(node)
+
+        if node == goal:
+            return _expandJumps(treePath(parents, goal), width), costs[goal]
+
+        x, y = node % width, node // width
+        for dx, dy in directions(x, y, parents[node]):
+            point = jump(x, y, dx, dy)
+            if point is None:
+                continue
+
+            jx, jy = point
+            successor = jy * width + jx
+
+            # every jump is a straight or diagonal line, so its cost is the octile distance
+            newCost = costs[node] + heuristic(node, successor)
+            if successor not in costs or newCost < costs[successor]:
+                costs[successor] = newCost
+                parents[successor] = node
+                heapq.heappush(queue, (newCost + heuristic(successor, goal), next(tie), successor))
+
+    # we couldn't find the goal... :(
+    return None, float("inf")
+
+
+def _expandJumps(points, width):
+    """Fills in the cells between consecutive jump points"""
+    path = [points[0]]
+    for a, b in zip(points, points[1:]):
+        ax, ay = a % width, a // width
+        bx, by = b % width, b // width
+        dx = (bx > ax) - (bx < ax)
+        dy = (by > ay) - (by < ay)
+        while (ax, ay) != (bx, by):
+            ax += dx
+            ay += dy
+            path.append(ay * width + ax)
+    return path
@@ -0,0 +1,97 @@
+import heapq
+from itertools import count
+from .weighted import bestPath
+
+
+def kShortestPaths(graph, start, goal, k):
+    """Finds the k lowest cost loopless paths between 2 nodes with Yen's
+    algorithm. Each new path is the cheapest "spur" off one of the paths
+    already found, so only about k * path length Dijkstra searches are run,
+    instead of enumerating every path
+
+    Args:
+        graph (dict): Search space represented by a weighted graph
+        start (str): Starting state
+        goal (str): Goal state
+        k (int): How many paths to find
+
+    Returns:
+        paths (list): Up to k (path, cost) tuples, cheapest first
+    """
+
+    if k <= 0:
+        return []
+
+    path, cost = bestPath(graph, start, goal)
+    if path is None:
+        return []
+
+    found = [(path, cost)]
+
+    # candidate paths, cheapest first. The counter breaks ties
+    tie = count()
+    candidates = []
+    seen = {tuple(path)}
+
+    while len(found) < k:
+        previous, _ = found[-1]
+
+        # branch off the previous path at every node along it
+        rootCost = 0
+        for i in range(len(previous) - 1):
+            spurNode = previous[i]
+            root = previous[:i + 1]
+
+            # don't follow any found path that shares this root, and don't revisit the root
+            bannedEdges = {(p[i], p[i + 1]) for p, _ in found if len(p) > i + 1 and p[:i + 1] == root}
+            bannedNodes = set(root[:-1])
+
+            spurPath, spurCost = bestPath(_FilteredGraph(graph, bannedNodes, bannedEdges), spurNode, goal)
+            if spurPath is not None:
+                candidate = root[:-1] + spurPath
+                if tuple(candidate) not in seen:
+                    seen.add(tuple(candidate))
+                    heapq.heappush(candidates, (rootCost + spurCost, next(tie), candidate))
+
+            rootCost += edgeWeight(graph, previous[i], previous[i + 1])
+
+        # we've run out of alternatives
+        if not candidates:
+            break
+
+        cost, _, path = heapq.heappop(candidates)
+        found.append((path, cost))
+
+    return found
+
+
+def edgeWeight(graph, node, neighbour):
+    """Returns the weight of the cheapest edge from node to neighbour
+
+    Args:
+        graph (dict): Search space represented by a weighted graph
+        node (str): The source node
+        neighbour (str): The target node
+
+    Returns:
+        (float): The weight
+    """
+    return min(w for n, w in graph.get(node, []) if n == neighbour)
+
+
+class _FilteredGraph(object):
+    """A view of a weighted graph with some nodes and edges left out"""
+
+    def __init__(self, graph, bannedNodes, bannedEdges):
+        self.graph = graph
+        self.bannedNodes = bannedNodes
+        self.bannedEdges = bannedEdges
+
+    def get(self, node, default=None):
+        if node in self.bannedNodes:
+            return default
+        neighbours = self.graph.get(node, default)
+        if neighbours is default:
+            return default
+        return [(n, w) for n, w in neighbours
+                if n not in self.bannedNodes and (node, n) not in self.bannedEdges]
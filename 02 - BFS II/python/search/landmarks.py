@@ -0,0 +1,134 @@
+import numpy as np
+from .csr import internNames
+from .weighted import dijkstra
+
+
+class Landmarks(object):
+    """ALT (A*, Landmarks, Triangle inequality) heuristics for any weighted
+    graph.
+
+    The lowest costs from a few landmark nodes to every node, and from every
+    node back to them, are precomputed. For any landmark L the triangle
+    inequality gives two lower bounds on the cost from a node to the goal:
+        cost(L, goal) - cost(L, node)  and  cost(node, L) - cost(goal, L)
+    and the heuristic is the best of these over all landmarks. It never
+    overestimates, so A* with it still finds the lowest cost path.
+    """
+
+    def __init__(self, graph, count=8, landmarks=None):
+        """Constructor for the Landmarks. Picks the landmarks and builds the
+        distance tables straight away
+
+        Args:
+            graph (dict): Search space represented by a weighted graph, where
+                neighbours are (name, weight) tuples
+            count (int): How many landmarks to pick
+            landmarks (list): Use these nodes as the landmarks instead of
+                picking them
+        """
+
+        # intern the node names, including nodes that only appear as neighbours
+        names, index = internNames(graph, weighted=True)
+        self.names = names
+        self.index = index
+        self.graph = graph
+        self.reverse = _reverse(graph)
+
+        # one row per node and one column per landmark, so a node's bounds are contiguous
+        n = len(names)
+        self.landmarks = []
+        self.fromLandmarks = np.empty((n, 0))
+        self.toLandmarks = np.empty((n, 0))
+
+        if landmarks is None:
+            self._addFarthest(count)
+        else:
+            for landmark in landmarks:
+                self._add(landmark)
+
+        self._goal = None
+
+    def _costs(self, graph, start):
+        """Returns the lowest cost from start to every node, inf if unreachable"""
+        costs, _ = dijkstra(graph, start)
+        row = np.full(len(self.names), np.inf)
+        row[[self.index[node] for node in costs]] = list(costs.values())
+        return row
+
+    def _add(self, landmark):
+        """Adds a landmark and its columns of the distance tables"""
+        self.landmarks.append(landmark)
+        self.fromLandmarks = np.column_stack([self.fromLandmarks, self._costs(self.graph, landmark)])
+        self.toLandmarks = np.column_stack([self.toLandmarks, self._costs(self.reverse, landmark)])
+
+    def _addFarthest(self, count):
+        """Adds landmarks one at a time, each as far as possible from the
+        ones before it. The first is the node farthest from an arbitrary node"""
+
+        if not self.names:
+            return
+
+        # nodes that can't be reached score inf, so other components get a landmark too
+        scores = self._costs(self.graph, self.names[0])
+        while len(self.landmarks) < count:
+            candidate = int(np.argmax(scores))
+
+            # every node is a landmark, or is cost 0 from one
+            if scores[candidate] <= 0:
+                break
+
+            self._add(self.names[candidate])
+            scores = self.fromLandmarks.min(axis=1)
+
+    def heuristic(self, node, goal):
+        """Estimates the cost from node to goal from the landmark tables. Pass
+        this as the heuristic to dijkstra or bestPath. Each new goal costs
+        one vectorised pass over the tables
+
+        Args:
+            node (str): The node
+            goal (str): The goal
+
+        Returns:
+            (float): A lower bound on the cost from node to goal
+        """
+
+        # the bounds for every node are worked out in one go the first time
+        # a goal is seen, so each call is just a list lookup
+        if goal != self._goal:
+            self._goal = goal
+            self._bounds = self.bounds(goal).tolist()
+
+        return self._bounds[self.index[node]]
+
+    def bounds(self, goal):
+        """Works out the heuristic from every node to a goal
+
+        Args:
+            goal (str): The goal
+
+        Returns:
+            (ndarray): The lower bound on the cost from each node id to the goal
+        """
+        g = self.index[goal]
+        with np.errstate(invalid="ignore"):
+            forward = self.fromLandmarks[g] - self.fromLandmarks
+            backward = self.toLandmarks - self.toLandmarks[g]
+
+        # inf - inf is nan, which fmax skips. A bound of inf means the goal
+        # can't be reached from the node at all
+        if not self.landmarks:
+            return np.zeros(len(self.names))
+        return np.fmax(np.fmax(np.fmax.reduce(forward, axis=1), np.fmax.reduce(backward, axis=1)), 0)
+
+    def __repr__(self):
+        return "Landmarks(nodes={}, landmarks={})".format(len(self.names), self.landmarks)
+
+
+def _reverse(graph):
+    """Returns a weighted graph with every edge turned around"""
+    reverse = {}
+    for node, neighbours in graph.items():
+        for neighbour, weight in neighbours:
+            reverse.setdefault(neighbour, []).append((node, weight))
+    return reverse
@@ -0,0 +1,122 @@
+import numpy as np
+from .csr import CSRGraph
+
+
+def loadEdgeList(path, weighted=False, directed=True, delimiter=None, intNames=False,
+                 output="csr", comment=b"#", skipRows=0, chunkSize=1 << 24):
+    """Loads a graph from a text file with one edge per line:
+    "source target" or "source target weight", separated by whitespace or a
+    delimiter such as ",". The file is read in chunks of bytes, and node names
+    are interned into integer ids as they are seen, so only the id arrays are
+    kept in memory, never the whole text.
+
+    With intNames=True the names must be non-negative integers and are used
+    as the ids directly. Each chunk is then parsed by NumPy in one call,
+    which is several times faster than interning names one by one.
+
+    Args:
+        path (str): The file to read
+        weighted (bool): Whether each line has a third column with the weight
+        directed (bool): If False, every edge is also added the other way
+        delimiter (str): The column separator, or None for any whitespace
+        intNames (bool): Whether the node names are integer ids
+        output (str): "csr" for a CSRGraph, or "dict" for the dict form
+        comment (bytes): Lines starting with this are skipped
+        skipRows (int): How many lines to skip at the top, e.g. a CSV header
+        chunkSize (int): How many bytes to read at a time
+
+    Returns:
+        graph: A CSRGraph, or a dict graph whose neighbours are names, or
+            (name, weight) tuples if weighted
+    """
+
+    if output not in ("csr", "dict"):
+        raise ValueError("output must be 'csr' or 'dict', not {!r}".format(output))
+
+    columns = 3 if weighted else 2
+    if isinstance(delimiter, str):
+        delimiter = delimiter.encode()
+    if isinstance(comment, str):
+        comment = comment.encode()
+
+    index = {}
+    sources, targets, weights = [], [], []
+
+    for chunk in _readLines(path, chunkSize, skipRows):
+        # turn the delimiter into whitespace, and drop comments and blank lines
+        if delimiter is not None:
+            chunk = chunk.replace(delimiter, b" ")
+        if comment and comment in chunk:
+            chunk = b"\n".join(line for line in chunk.split(b"\n")
+                               if not line.lstrip().startswith(comment))
+        if not chunk.strip():
+            continue
+
+        if intNames:
+            # NumPy parses the whole chunk in C. Integers parse a lot faster than
+            # floats, so floats are only used if a weight looks like one
+            isFloat = weighted and any(c in chunk for c in (b".", b"e", b"E", b"n", b"N", b"i", b"I"))
+            values = np.fromstring(chunk, dtype=np.float64 if isFloat else np.int64, sep=" ")
+            if len(values) % columns:
+                raise ValueError("Each line of {} should have {} columns".format(path, columns))
+            values = values.reshape(-1, columns)
+            sources.append(values[:, 0].astype(np.int64))
+            targets.append(values[:, 1].astype(np.int64))
+            if weighted:
+                weights.append(values[:, 2].astype(np.float64))
+        else:
+            tokens = chunk.split()
+            if len(tokens) % columns:
+                raise ValueError("Each line of {} should have {} columns".format(path, columns))
+            if weighted:
+                weights.append(np.array(tokens[2::3], dtype=np.float64))
+                del tokens[2::3]
+
+            # intern every name. len(index) is evaluated before the new name is added
+            setdefault = index.setdefault
+            ids = np.array([setdefault(name, len(index)) for name in tokens], dtype=np.int64)
+            sources.append(ids[0::2])
+            targets.append(ids[1::2])
+
+    sources = np.concatenate(sources) if sources else np.zeros(0, dtype=np.int64)
+    targets = np.concatenate(targets) if targets else np.zeros(0, dtype=np.int64)
+    weights = (np.concatenate(weights) if weights else np.zeros(0)) if weighted else None
+
+    if intNames:
+        if len(sources) and min(sources.min(), targets.min()) < 0:
+            raise ValueError("Integer node names can't be negative")
+        names = range(int(max(sources.max(), targets.max())) + 1 if len(sources) else 0)
+    else:
+        names = [name.decode() for name in index]
+
+    if not directed:
+        sources, targets = np.concatenate([sources, targets]), np.concatenate([targets, sources])
+        if weighted:
+            weights = np.concatenate([weights, weights])
+
+    graph = CSRGraph.fromEdges(names, sources, targets, weights)
+    return graph.toDict() if output == "dict" else graph
+
+
+def _readLines(path, chunkSize, skipRows):
+    """Reads a file in chunks of bytes that always end at the end of a line"""
+    with open(path, "rb") as f:
+        for _ in range(skipRows):
+            f.readline()
+
+        leftover = b""
+        while True:
+            data = f.read(chunkSize)
+            if not data:
+                break
+
+            # hold back the unfinished last line until the next chunk
+            end = data.rfind(b"\n")
+            if end < 0:
+                leftover += data
+                continue
+            yield leftover + data[:end + 1]
+            leftover = data[end + 1:]
+
+        if leftover.strip():
+            yield leftover + b"\n"
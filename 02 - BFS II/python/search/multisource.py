@@ -0,0 +1,85 @@
+import numpy as np
+
+
+def multiSourceBfs(graph, sources, chunk=64):
+    """Finds the hop distances from many sources to every node of a CSRGraph
+    at once. Each node keeps one bit per source, packed 64 to a uint64 word,
+    for "seen" and for "in the frontier". A level is one pass over the edges
+    of the nodes that are in any traversal's frontier: the bits are ORed
+    along each edge, so a node shared by many traversals is expanded once
+    for all of them.
+
+    Args:
+        graph (CSRGraph): Search space represented by a CSR graph
+        sources (list): The starting states
+        chunk (int): How many sources to run together, a multiple of 64.
+            Bigger chunks share more work on small-world graphs, but each
+            level then costs more words per node, which doesn't pay off on
+            long thin graphs like grids
+
+    Returns:
+        distances (ndarray): A (sources x nodes) int32 matrix of hops from
+            each source to each node id, -1 if the node can't be reached
+    """
+
+    ids = np.array([graph.index[s] for s in sources], dtype=np.int64)
+    distances = np.full((len(ids), len(graph)), -1, dtype=np.int32)
+
+    chunk = max(64, chunk - chunk % 64)
+    for first in range(0, len(ids), chunk):
+        distances[first:first + chunk] = _bitParallelBfs(graph, ids[first:first + chunk])
+
+    return distances
+
+
+def _bitParallelBfs(graph, ids):
+    """Runs the bit-parallel BFS for one batch of source ids"""
+
+    n = len(graph)
+    offsets = graph.offsets
+    neighbours = graph.neighbours
+    numSources = len(ids)
+    words = (numSources + 63) // 64
+
+    # stored node-major while searching, so each level writes whole rows
+    distances = np.full((n, numSources), -1, dtype=np.int32)
+    distances[ids, np.arange(numSources)] = 0
+
+    # bit s of word s // 64 belongs to source s
+    bits = np.left_shift(np.uint64(1), (np.arange(numSources) % 64).astype(np.uint64))
+    frontier = np.zeros((n, words), dtype=np.uint64)
+    np.bitwise_or.at(frontier, (ids, np.arange(numSources) // 64), bits)
+    seen = frontier.copy()
+    active = np.unique(ids)
+
+    level = 0
+    while len(active) > 0:
+        level += 1
+
+        # gather the edges of every node that's in some frontier
+        starts = offsets[active]
+        counts = offsets[active + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            break
+        firsts = np.cumsum(counts) - counts
+        edges = np.repeat(starts - firsts, counts) + np.arange(total)
+        targets = neighbours[edges].astype(np.int64)
+        owners = np.repeat(active, counts)
+
+        # push each frontier's bits along its edges, then drop what was seen
+        following = np.zeros((n, words), dtype=np.uint64)
+        np.bitwise_or.at(following, targets, frontier[owners])
+        following &= ~seen
+        seen |= following
+
+        active = np.flatnonzero(following.any(axis=1))
+        frontier = following
+
+        # unpack the new bits of each reached node into one flag per source
+        reached = np.unpackbits(following[active].astype("<u8").view(np.uint8), axis=1, bitorder="little")
+        rows = distances[active]
+        rows[reached[:, :numSources].view(bool)] = level
+        distances[active] = rows
+
+    return distances.T
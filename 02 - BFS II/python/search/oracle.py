@@ -0,0 +1,201 @@
+import hashlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .csr import decodeNames, encodeNames, internNames
+
+
+class DistanceOracle(object):
+    """Precomputed all-pairs hop distances and next hops for a graph.
+
+    The tables are built with one BFS per node, and then answer shortest path
+    queries in O(path length) without searching. They take O(n^2) memory,
+    so this is meant for small and medium graphs that are queried a lot.
+
+    The graph needs a version that goes up whenever it changes, like a
+    VersionedGraph or a GridGraph. The oracle rebuilds itself the next time it
+    is queried after the version has changed, so it never gives a stale answer.
+    """
+
+    def __init__(self, graph, workers=1):
+        """Constructor for the DistanceOracle. Builds the tables straight away
+
+        Args:
+            graph (VersionedGraph): Search space represented by a graph
+            workers (int): How many processes to run the BFSs in
+        """
+
+        _checkVersioned(graph)
+        self.graph = graph
+        self.workers = workers
+        self.build()
+
+    def build(self):
+        """(Re)builds the distance and next hop tables from the graph"""
+
+        graph = self.graph
+        self.version = graph.version
+        self.fingerprint = fingerprint(graph)
+
+        # intern the node names, including nodes that only appear as neighbours
+        names, index = internNames(graph)
+        self.names = names
+        self.index = index
+
+        # the adjacency as plain lists of ids, which is cheap to send to workers
+        adjacency = [[index[x] for x in graph.get(name, [])] for name in names]
+
+        n = len(names)
+        self.distances = np.full((n, n), -1, dtype=np.int32)
+        self.nextHops = np.full((n, n), -1, dtype=np.int32)
+
+        if self.workers > 1 and n > 1:
+            # split the sources into one chunk per worker
+            chunks = [list(range(n))[i::self.workers] for i in range(self.workers)]
+            with ProcessPoolExecutor(self.workers, initializer=_setAdjacency, initargs=(adjacency,)) as pool:
+                for chunk, rows in zip(chunks, pool.map(_bfsRows, chunks)):
+                    for source, (distances, nextHops) in zip(chunk, rows):
+                        self.distances[source] = distances
+                        self.nextHops[source] = nextHops
+        else:
+            for source in range(n):
+                self.distances[source], self.nextHops[source] = _bfsRow(adjacency, source)
+
+    def _refresh(self):
+        """Rebuilds the tables if the graph has changed since they were built"""
+        if self.graph.version != self.version:
+            self.build()
+
+    def distance(self, start, goal):
+        """Returns the number of hops between 2 nodes
+
+        Args:
+            start (str): Starting state
+            goal (str): Goal state
+
+        Returns:
+            (int): The hop count, or None if the goal can't be reached
+        """
+        self._refresh()
+        d = int(self.distances[self.index[start], self.index[goal]])
+        return None if d < 0 else d
+
+    def shortestPath(self, start, goal):
+        """Returns a shortest path between 2 nodes, by following next hops
+
+        Args:
+            start (str): Starting state
+            goal (str): Goal state
+
+        Returns:
+            path (list): List of the states that bring you from the start to
+                the goal state, in the quickest way possible, or None
+        """
+        self._refresh()
+        s, g = self.index[start], self.index[goal]
+        if self.distances[s, g] < 0:
+            return None
+
+        path = [s]
+        while path[-1] != g:
+            path.append(int(self.nextHops[path[-1], g]))
+        return [self.names[i] for i in path]
+
+    def save(self, path):
+        """Saves the tables to a .npz file
+
+        Args:
+            path (str): The file to write
+
+        Raises:
+            TypeError: If a node name isn't a string, a number or a tuple
+        """
+        self._refresh()
+        np.savez(path, distances=self.distances, nextHops=self.nextHops,
+                 names=np.array(encodeNames(self.names)),
+                 fingerprint=np.array(self.fingerprint))
+
+    @classmethod
+    def load(cls, path, graph, workers=1):
+        """Loads tables saved with save. If they were built from a different
+        graph, they are rebuilt instead
+
+        Args:
+            path (str): The file to read
+            graph (VersionedGraph): The graph the tables should describe
+            workers (int): How many processes to use if a rebuild is needed
+
+        Returns:
+            (DistanceOracle): The oracle
+        """
+
+        _checkVersioned(graph)
+        with np.load(path) as data:
+            if str(data["fingerprint"]) != fingerprint(graph):
+                return cls(graph, workers)
+
+            oracle = cls.__new__(cls)
+            oracle.graph = graph
+            oracle.workers = workers
+            oracle.version = graph.version
+            oracle.fingerprint = str(data["fingerprint"])
+            oracle.names = decodeNames(str(data["names"]))
+            oracle.index = {name: i for i, name in enumerate(oracle.names)}
+            oracle.distances = data["distances"]
+            oracle.nextHops = data["nextHops"]
+        return oracle
+
+
+def fingerprint(graph):
+    """Returns a hash of a graph's adjacency, used to spot a changed graph
+
+    Args:
+        graph (dict): Search space represented by a graph
+
+    Returns:
+        (str): A hex digest
+    """
+    items = [(node, list(neighbours)) for node, neighbours in graph.items()]
+    return hashlib.sha1(repr(items).encode("utf-8")).hexdigest()
+
+
+def _checkVersioned(graph):
+    """Raises a TypeError if the graph can't tell the oracle it has changed"""
+    if getattr(graph, "version", None) is None:
+        raise TypeError("DistanceOracle needs a graph with a version, e.g. a VersionedGraph")
+
+
+def _bfsRow(adjacency, source):
+    """Runs one BFS over an id adjacency, returning its distance and next hop rows"""
+
+    n = len(adjacency)
+    distances = [-1] * n
+    nextHops = [-1] * n
+    distances[source] = 0
+    nextHops[source] = source
+
+    queue = deque([source])
+    while queue:
+        node = queue.popleft()
+        for neighbour in adjacency[node]:
+            if distances[neighbour] < 0:
+                distances[neighbour] = distances[node] + 1
+
+                # the first step towards a neighbour of the source is the neighbour itself
+                nextHops[neighbour] = neighbour if node == source else nextHops[node]
+                queue.append(neighbour)
+
+    return distances, nextHops
+
+
+# the adjacency shared by every task in a worker process
+_adjacency = None
+
+
+def _setAdjacency(adjacency):
+    global _adjacency
+    _adjacency = adjacency
+
+
+def _bfsRows(sources):
+    return [_bfsRow(_adjacency, source) for source in sources]
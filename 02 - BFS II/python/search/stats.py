@@ -0,0 +1,93 @@
+import json
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+
+
+class SearchStats(object):
+    """Counters and timings for one search.
+
+    Pass an instance as stats=... to a search function to fill it in. Each
+    search has a single loop that only updates the counters when stats is
+    given, so searches without it just pay for a few None checks per node.
+
+    Attributes:
+        nodesExpanded (int): Nodes whose neighbours were generated
+        edgesScanned (int): Neighbours looked at
+        duplicatePushes (int): Pushes of a node that was already queued once
+        peakQueue (int): The largest the queue (or stack) got
+        wallTime (float): Seconds spent in the search function
+        phases (dict): Seconds spent in each named phase
+    """
+
+    def __init__(self, name=None):
+        """Constructor for the SearchStats
+
+        Args:
+            name (str): Optional label, e.g. the algorithm or the query
+        """
+        self.name = name
+        self.nodesExpanded = 0
+        self.edgesScanned = 0
+        self.duplicatePushes = 0
+        self.peakQueue = 0
+        self.wallTime = 0.0
+        self.phases = {}
+
+    @contextmanager
+    def phase(self, name):
+        """Times a block of code, adding it to the named phase and the wall time
+
+        Args:
+            name (str): The phase name
+        """
+        t1 = perf_counter()
+        try:
+            yield self
+        finally:
+            elapsed = perf_counter() - t1
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+            self.wallTime += elapsed
+
+    def queued(self, size):
+        """Records the current queue size, keeping the peak"""
+        if size > self.peakQueue:
+            self.peakQueue = size
+
+    def asDict(self):
+        """Returns the stats as a plain dict"""
+        return {
+            "name": self.name,
+            "nodesExpanded": self.nodesExpanded,
+            "edgesScanned": self.edgesScanned,
+            "duplicatePushes": self.duplicatePushes,
+            "peakQueue": self.peakQueue,
+            "wallTime": self.wallTime,
+            "phases": dict(self.phases),
+        }
+
+    def writeJSONL(self, f):
+        """Appends the stats as one JSON line
+
+        Args:
+            f: A path, or a file object opened for writing text
+        """
+        line = json.dumps(self.asDict()) + "\n"
+        if isinstance(f, str):
+            with open(f, "a") as fp:
+                fp.write(line)
+        else:
+            f.write(line)
+
+    def __repr__(self):
+        return "SearchStats({})".format(", ".join(
+            "{}={}".format(k, v) for k, v in self.asDict().items() if k != "phases"))
+
+
+def statsPhase(stats, name):
+    """Times a block as a phase of stats, or does nothing if stats is None
+
+    Args:
+        stats (SearchStats): The stats to fill in, or None
+        name (str): The phase name
+    """
+    return nullcontext() if stats is None else stats.phase(name)
@@ -0,0 +1,300 @@
+from array import array
+from collections import deque
+import numpy as np
+from .stats import statsPhase
+
+
+def bfsTree(graph, start, goal=None, stats=None):
+    """Builds a BFS tree of parent pointers over any graph with a get method
+    (dict, CSRGraph, GridGraph, ...)
+
+    Args:
+        graph (dict): Search space represented by a graph
+        start (str): Starting state
+        goal (str): If given, stop as soon as the goal is discovered
+        stats (SearchStats): If given, filled in with counters and timings
+
+    Returns:
+        parents (dict): The parent of every discovered node, None for the start
+    """
+
+    with statsPhase(stats, "search"):
+        parents = {start: None}
+        if start == goal:
+            return parents
+
+        # the FIFO queue only holds nodes, not paths
+        queue = deque([start])
+        if stats is not None:
+            stats.queued(1)
+
+        while queue:
+            node = queue.popleft()
+            neighbours = graph.get(node, [])
+            if stats is not None:
+                stats.nodesExpanded += 1
+                stats.edgesScanned += len(neighbours)
+
+            for neighbour in neighbours:
+                if neighbour not in parents:
+                    parents[neighbour] = node
+                    if neighbour == goal:
+                        return parents
+                    queue.append(neighbour)
+
+            if stats is not None:
+                stats.queued(len(queue))
+
+        return parents
+
+
+def bfsPath(graph, start, goal, stats=None):
+    """Finds shortest path between 2 nodes in any graph with a get method
+
+    Args:
+        graph (dict): Search space represented by a graph
+        start (str): Starting state
+        goal (str): Goal state
+        stats (SearchStats): If given, filled in with counters and timings
+
+    Returns:
+        path (list): List of the states that bring you from the start to
+            the goal state, in the quickest way possible, or None
+    """
+    parents = bfsTree(graph, start, goal, stats)
+    if goal not in parents:
+        return None
+    with statsPhase(stats, "path"):
+        return treePath(parents, goal)
+
+
+def treePath(parents, node, names=None):
+    """Rebuilds the path from the root of a search tree to a node, e.g. the
+    parents of a BFS or Dijkstra
+
+    Args:
+        parents (dict): The parent of every node, None for the root. An array
+            of parent ids works too, with the root as its own parent
+        node (str): The last node of the path
+        names (list): If given, the path is of node ids, which are turned
+            into these names
+
+    Returns:
+        path (list): The states from the root to the node
+    """
+    path = [node]
+    parent = parents[node]
+    while parent is not None and parent != path[-1]:
+        path.append(parent)
+        parent = parents[parent]
+    path.reverse()
+    if names is not None:
+        return [names[i] for i in path]
+    return path
+
+
+def bfsCSR(graph, start, stats=None):
+    """Visits all the nodes of a CSRGraph (connected component) using BFS
+
+    Args:
+        graph (CSRGraph): Search space represented by a CSR graph
+        start (str): Starting state
+        stats (SearchStats): If given, filled in with counters and timings
+
+    Returns:
+        explored (list): List of the explored nodes, in the same order as
+            bfs_connected_component
+    """
+
+    with statsPhase(stats, "search"):
+        # memoryviews give us plain ints without going through numpy scalars
+        offsets = memoryview(graph.offsets)
+        neighbours = memoryview(graph.neighbours)
+
+        # one byte per node to keep track of all visited nodes
+        explored = bytearray(len(graph))
+
+        s = graph.index[start]
+        explored[s] = 1
+        order = [s]
+
+        # the FIFO queue
+        queue = deque(order)
+        if stats is not None:
+            stats.queued(1)
+
+        while queue:
+            node = queue.popleft()
+            first, last = offsets[node], offsets[node + 1]
+
+            # mark neighbours as they are discovered, so each is queued once
+            for neighbour in neighbours[first:last]:
+                if not explored[neighbour]:
+                    explored[neighbour] = 1
+                    order.append(neighbour)
+                    queue.append(neighbour)
+
+            if stats is not None:
+                stats.nodesExpanded += 1
+                stats.edgesScanned += last - first
+                stats.queued(len(queue))
+
+    names = graph.names
+    return [names[i] for i in order]
+
+
+def dfsCSR(graph, start, stats=None):
+    """Visits all the nodes of a CSRGraph (connected component) using DFS
+
+    Args:
+        graph (CSRGraph): Search space represented by a CSR graph
+        start (str): Starting state
+        stats (SearchStats): If given, filled in with counters and timings
+
+    Returns:
+        explored (list): List of the explored nodes, in the same order as
+            dfs_connected_component
+    """
+
+    with statsPhase(stats, "search"):
+        offsets = memoryview(graph.offsets)
+        neighbours = memoryview(graph.neighbours)
+        explored = bytearray(len(graph))
+        order = []
+
+        # the LIFO stack
+        stack = [graph.index[start]]
+
+        # when counting, remember what has been pushed before to spot the duplicates
+        if stats is not None:
+            pushed = bytearray(len(graph))
+            pushed[stack[0]] = 1
+            stats.queued(1)
+
+        while stack:
+            node = stack.pop()
+
+            if not explored[node]:
+                explored[node] = 1
+                order.append(node)
+                children = neighbours[offsets[node]:offsets[node + 1]]
+
+                if stats is not None:
+                    stats.nodesExpanded += 1
+                    stats.edgesScanned += len(children)
+                    for neighbour in children:
+                        if pushed[neighbour]:
+                            stats.duplicatePushes += 1
+                        pushed[neighbour] = 1
+
+                # push neighbours in order, so the last one is visited first
+                stack.extend(children)
+
+                if stats is not None:
+                    stats.queued(len(stack))
+
+    names = graph.names
+    return [names[i] for i in order]
+
+
+def bfsShortestPathCSR(graph, start, goal):
+    """Finds shortest path between 2 nodes in a CSRGraph using BFS
+
+    Args:
+        graph (CSRGraph): Search space represented by a CSR graph
+        start (str): Starting state
+        goal (str): Goal state
+
+    Returns:
+        path (list): List of the states that bring you from the start to
+            the goal state, in the quickest way possible, or None
+    """
+
+    if start == goal:
+        return [start]
+
+    s = graph.index[start]
+    g = graph.index.get(goal)
+    if g is None:
+        return None
+
+    offsets = memoryview(graph.offsets)
+    neighbours = memoryview(graph.neighbours)
+
+    # one predecessor per node, -1 means undiscovered
+    parents = array("q", [-1]) * len(graph)
+    parents[s] = s
+
+    queue = deque([s])
+
+    while queue:
+        node = queue.popleft()
+
+        for neighbour in neighbours[offsets[node]:offsets[node + 1]]:
+            if parents[neighbour] == -1:
+                parents[neighbour] = node
+
+                # walk the parents back to the start to build the path
+                if neighbour == g:
+                    return treePath(parents, g, graph.names)
+
+                queue.append(neighbour)
+
+    # we couldn't find the goal... :(
+    return None
+
+
+def bfsLevels(graph, start):
+    """Finds the hop distance from a start node to every node of a CSRGraph,
+    expanding a whole BFS level at a time with vectorised array operations
+
+    Args:
+        graph (CSRGraph): Search space represented by a CSR graph
+        start (str): Starting state
+
+    Returns:
+        distances (ndarray): Hops from the start to each node id, -1 if the
+            node can't be reached
+    """
+
+    n = len(graph)
+    offsets = graph.offsets
+    neighbours = graph.neighbours
+
+    distances = np.full(n, -1, dtype=np.int32)
+    visited = np.zeros(n, dtype=bool)
+
+    # the frontier is kept as an array of node ids
+    frontier = np.array([graph.index[start]], dtype=np.int64)
+    visited[frontier] = True
+    distances[frontier] = 0
+
+    # scratch space used to drop duplicate discoveries
+    owner = np.empty(n, dtype=np.int64)
+
+    level = 0
+    while len(frontier) > 0:
+        level += 1
+
+        # gather the neighbour lists of the whole frontier in one go
+        starts = offsets[frontier]
+        counts = offsets[frontier + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            break
+        firsts = np.cumsum(counts) - counts
+        edges = np.repeat(starts - firsts, counts) + np.arange(total)
+        found = neighbours[edges]
+
+        # keep the ones we haven't seen yet
+        found = found[~visited[found]]
+
+        # a node reached from several frontier nodes only counts once
+        owner[found] = np.arange(len(found))
+        found = found[owner[found] == np.arange(len(found))]
+
+        visited[found] = True
+        distances[found] = level
+        frontier = found.astype(np.int64)
+
+    return distances
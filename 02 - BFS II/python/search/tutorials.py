@@ -0,0 +1,23 @@
+import importlib.util
+import os
+
+
+# the repo root, so we can load the tutorial implementations from their lessons
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..")
+
+
+def loadFunction(path, name):
+    """Loads a function from a python file that can't be imported by name,
+    like the numbered files of the tutorial lessons
+
+    Args:
+        path (str): The file, relative to the repo root
+        name (str): The function name
+
+    Returns:
+        (function): The function
+    """
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, name)
@@ -0,0 +1,71 @@
+class VersionedGraph(dict):
+    """A dict graph that counts its own changes.
+
+    Every change made through the dict methods or addEdge/removeEdge bumps
+    version, so anything built from the graph (distance tables, caches) can
+    tell when it is out of date. Neighbour lists are stored as tuples so they
+    can't be changed behind the graph's back.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Constructor for the VersionedGraph. Takes the same arguments as dict,
+        e.g. VersionedGraph(graph) or VersionedGraph(enumerate(tree))
+        """
+        super().__init__()
+        self.version = 0
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, node, neighbours):
+        super().__setitem__(node, tuple(neighbours))
+        self.version += 1
+
+    def __delitem__(self, node):
+        super().__delitem__(node)
+        self.version += 1
+
+    def update(self, *args, **kwargs):
+        for node, neighbours in dict(*args, **kwargs).items():
+            self[node] = neighbours
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, node, neighbours=()):
+        if node not in self:
+            self[node] = neighbours
+        return self[node]
+
+    def pop(self, node, *default):
+        if node in self:
+            self.version += 1
+        return super().pop(node, *default)
+
+    def popitem(self):
+        item = super().popitem()
+        self.version += 1
+        return item
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+    def addEdge(self, node, neighbour):
+        """Adds an edge from node to neighbour
+
+        Args:
+            node: The source node
+            neighbour: The target node, or a (name, weight) tuple
+        """
+        self[node] = self.get(node, ()) + (neighbour,)
+
+    def removeEdge(self, node, neighbour):
+        """Removes the first edge from node to neighbour
+
+        Args:
+            node: The source node
+            neighbour: The target node, or a (name, weight) tuple
+        """
+        neighbours = list(self[node])
+        neighbours.remove(neighbour)
+        self[node] = neighbours
@@ -0,0 +1,176 @@
+import heapq
+from itertools import count
+from .stats import statsPhase
+from .traversal import treePath
+
+
+def dijkstra(graph, start, goal=None, heuristic=None, stats=None):
+    """Finds the lowest cost paths from a start node in a weighted graph,
+    using a priority queue. With a heuristic this becomes A*
+
+    Args:
+        graph (dict): Search space represented by a weighted graph, where
+            neighbours are (name, weight) tuples
+        start (str): Starting state
+        goal (str): Goal state. If given, the search stops as soon as the
+            goal's cost is known
+        heuristic (function): heuristic(node, goal) estimating the cost left
+            to the goal. It must never overestimate for the result to be optimal
+        stats (SearchStats): If given, filled in with counters and timings
+
+    Returns:
+        tuple (costs, parents): The cost of every settled node, and the parent
+            of every settled node and its ancestors on the lowest cost path
+            (None for the start)
+    """
+
+    with statsPhase(stats, "search"):
+        costs = {start: 0}
+        parents = {start: None}
+        settled = set()
+
+        # the counter breaks ties, so nodes never need to be compared
+        tie = count()
+        queue = [(0, next(tie), start)]
+        if stats is not None:
+            stats.queued(1)
+
+        while queue:
+            _, _, node = heapq.heappop(queue)
+
+            # skip stale queue entries for nodes we have already settled
+            if node in settled:
+                continue
+            settled.add(node)
+
+            # with an admissible heuristic the goal's cost is final once popped
+            if node == goal:
+                break
+
+            cost = costs[node]
+            neighbours = graph.get(node, [])
+            if stats is not None:
+                stats.nodesExpanded += 1
+                stats.edgesScanned += len(neighbours)
+
+            for neighbour, weight in neighbours:
+                newCost = cost + weight
+
+                # only queue a neighbour if we found a cheaper way to it
+                if neighbour not in costs or newCost < costs[neighbour]:
+                    # the node is already in the queue at a worse cost
+                    if stats is not None and neighbour in costs:
+                        stats.duplicatePushes += 1
+
+                    costs[neighbour] = newCost
+                    parents[neighbour] = node
+
+                    # an inconsistent heuristic can improve a settled node, so reopen it
+                    settled.discard(neighbour)
+
+                    priority = newCost
+                    if heuristic is not None:
+                        priority += heuristic(neighbour, goal)
+                    heapq.heappush(queue, (priority, next(tie), neighbour))
+
+            if stats is not None:
+                stats.queued(len(queue))
+
+        return _settledTrees(costs, parents, settled)
+
+
+def _settledTrees(costs, parents, settled):
+    """Drops the costs of nodes that were queued but never settled. Parents
+    are kept for every ancestor of a settled node, since a node on the path
+    to a settled node can be reopened by an inconsistent heuristic (or float
+    rounding) and not be settled again before the search stops"""
+    kept = {}
+    for node in settled:
+        while node is not None and node not in kept:
+            kept[node] = parents[node]
+            node = parents[node]
+    return {node: costs[node] for node in settled}, kept
+
+
+def bestPath(graph, start, goal, heuristic=None, stats=None):
+    """Finds the lowest cost path between 2 nodes in a weighted graph
+
+    Args:
+        graph (dict): Search space represented by a weighted graph
+        start (str): Starting state
+        goal (str): Goal state
+        heuristic (function): Optional admissible heuristic(node, goal) for A*
+        stats (SearchStats): If given, filled in with counters and timings
+
+    Returns:
+        tuple (path, cost): The list of states from start to goal, and its
+            total weight, or (None, inf) if the goal can't be reached
+    """
+
+    costs, parents = dijkstra(graph, start, goal, heuristic, stats)
+
+    # we couldn't find the goal... :(
+    if goal not in costs:
+        return None, float("inf")
+
+    with statsPhase(stats, "path"):
+        return treePath(parents, goal), costs[goal]
+
+
+def bestPathCSR(graph, start, goal, heuristic=None):
+    """Finds the lowest cost path between 2 nodes of a weighted CSRGraph,
+    working on node ids and the raw arrays instead of names
+
+    Args:
+        graph (CSRGraph): Search space represented by a weighted CSR graph
+        start (str): Starting state
+        goal (str): Goal state
+        heuristic (function): Optional admissible heuristic(nodeId, goalId)
+            for A*. Note that it is given node ids, not names
+
+    Returns:
+        tuple (path, cost): The list of states from start to goal, and its
+            total weight, or (None, inf) if the goal can't be reached
+    """
+
+    s = graph.index[start]
+    g = graph.index.get(goal)
+    if g is None:
+        return None, float("inf")
+
+    offsets = memoryview(graph.offsets)
+    neighbours = memoryview(graph.neighbours)
+
+    # an unweighted graph counts every edge as 1, without an array of ones
+    weights = None if graph.weights is None else memoryview(graph.weights)
+
+    costs = {s: 0}
+    parents = {s: None}
+    settled = set()
+    queue = [(0, s)]
+
+    while queue:
+        _, node = heapq.heappop(queue)
+        if node in settled:
+            continue
+        settled.add(node)
+
+        if node == g:
+            return treePath(parents, g, graph.names), costs[g]
+
+        cost = costs[node]
+        for e in range(offsets[node], offsets[node + 1]):
+            neighbour = neighbours[e]
+            newCost = cost + (1 if weights is None else weights[e])
+            if neighbour not in costs or newCost < costs[neighbour]:
+                costs[neighbour] = newCost
+                parents[neighbour] = node
+                settled.discard(neighbour)
+
+                priority = newCost
+                if heuristic is not None:
+                    priority += heuristic(neighbour, g)
+                heapq.heappush(queue, (priority, neighbour))
+
+    # we couldn't find the goal... :(
+    return None, float("inf")